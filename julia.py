@@ -1,2217 +1,4 @@
-import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import pandas as pd
-import numpy as np
+from julia_guide import app
 
-# Page configuration
-st.set_page_config(
-    page_title="دليل لغة Julia للاقتصاديين",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS for beautiful design
-st.markdown("""
-    <style>
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        direction: rtl;
-    }
-    .stApp {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-    }
-    .css-1d391kg {
-        direction: rtl;
-    }
-    .block-container {
-        padding: 2rem;
-        direction: rtl;
-    }
-    h1, h2, h3 {
-        color: #2d3748;
-        font-family: 'Arial', sans-serif;
-        direction: rtl;
-        text-align: right;
-    }
-    .stButton>button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border-radius: 10px;
-        padding: 0.5rem 2rem;
-        border: none;
-        font-size: 16px;
-        font-weight: bold;
-        transition: all 0.3s;
-    }
-    .stButton>button:hover {
-        transform: scale(1.05);
-        box-shadow: 0 5px 15px rgba(0,0,0,0.3);
-    }
-    .code-block {
-        background-color: #1e1e1e;
-        color: #d4d4d4;
-        padding: 1rem;
-        border-radius: 10px;
-        direction: ltr;
-        text-align: left;
-        font-family: 'Courier New', monospace;
-    }
-    .output-block {
-        background-color: #f7fafc;
-        padding: 1rem;
-        border-radius: 10px;
-        border-left: 4px solid #667eea;
-        direction: ltr;
-        text-align: left;
-    }
-    .info-box {
-        background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        border-right: 5px solid #667eea;
-        margin: 1rem 0;
-        direction: rtl;
-    }
-    .warning-box {
-        background: linear-gradient(135deg, #fc466b15 0%, #3f5efb15 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        border-right: 5px solid #fc466b;
-        margin: 1rem 0;
-        direction: rtl;
-    }
-    .success-box {
-        background: linear-gradient(135deg, #11998e15 0%, #38ef7d15 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        border-right: 5px solid #11998e;
-        margin: 1rem 0;
-        direction: rtl;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-# Header
-st.markdown("""
-    <h1 style='text-align: center; color: #667eea; font-size: 3rem; margin-bottom: 0;'>
-        📊 دليل لغة Julia الشامل للاقتصاديين
-    </h1>
-    <h3 style='text-align: center; color: #764ba2; margin-top: 0;'>
-        إعداد: د. مروان رودان
-    </h3>
-    <p style='text-align: center; font-size: 1.2rem; color: #4a5568;'>
-        دليل تفاعلي احترافي للطلاب والباحثين العرب
-    </p>
-    <hr style='border: 2px solid #667eea; margin: 2rem 0;'>
-""", unsafe_allow_html=True)
-
-# Sidebar navigation
-st.sidebar.markdown("## 🎯 القائمة الرئيسية")
-st.sidebar.markdown("---")
-
-menu = st.sidebar.radio(
-    "اختر القسم:",
-    [
-        "🏠 مقدمة عن Julia",
-        "📝 الأساسيات",
-        "🔢 أنواع البيانات",
-        "➕ العمليات الحسابية",
-        "🔄 الحلقات التكرارية",
-        "⚖️ الشروط",
-        "📊 المصفوفات والجداول",
-        "📈 الرسوم البيانية",
-        "🎲 الدوال",
-        "📦 الحزم الاقتصادية",
-        "🔍 معالجة الأخطاء",
-        "💼 تطبيقات اقتصادية"
-    ]
-)
-
-# Section 1: Introduction
-if menu == "🏠 مقدمة عن Julia":
-    st.markdown("## 🏠 مقدمة عن لغة Julia")
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown("""
-        <div class='info-box'>
-        <h3>ما هي Julia؟</h3>
-        <p style='font-size: 1.1rem; line-height: 1.8;'>
-        Julia هي لغة برمجة حديثة عالية الأداء مصممة خصيصاً للحوسبة العلمية والتحليل الاقتصادي.
-        تجمع بين سرعة لغات مثل C وسهولة لغات مثل Python.
-        </p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown("""
-        <div class='success-box'>
-        <h3>لماذا Julia للاقتصاديين؟</h3>
-        <ul style='font-size: 1.1rem; line-height: 1.8;'>
-        <li>⚡ سرعة فائقة في المعادلات الاقتصادية المعقدة</li>
-        <li>📊 مكتبات قوية للتحليل الاقتصادي القياسي</li>
-        <li>🔢 دعم ممتاز للجبر الخطي والمصفوفات</li>
-        <li>🎯 سهولة في كتابة النماذج الاقتصادية</li>
-        <li>🆓 مجانية ومفتوحة المصدر</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        # Performance comparison chart
-        languages = ['Julia', 'Python', 'R', 'MATLAB']
-        speed = [1.0, 0.15, 0.12, 0.18]
-
-        fig = go.Figure(data=[
-            go.Bar(
-                x=languages,
-                y=speed,
-                marker=dict(
-                    color=['#667eea', '#fc466b', '#3f5efb', '#11998e'],
-                    line=dict(color='white', width=2)
-                ),
-                text=[f'{s * 100:.0f}%' for s in speed],
-                textposition='auto',
-            )
-        ])
-
-        fig.update_layout(
-            title=dict(
-                text='مقارنة السرعة (Julia = 100%)',
-                font=dict(size=20, color='#2d3748')
-            ),
-            xaxis_title='اللغة البرمجية',
-            yaxis_title='السرعة النسبية',
-            template='plotly_white',
-            height=400
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("""
-        <div class='warning-box'>
-        <h3>⚠️ ملاحظات مهمة</h3>
-        <p style='font-size: 1.1rem; line-height: 1.8;'>
-        • Julia تستخدم الترقيم من 1 (وليس من 0 مثل Python)<br>
-        • حساسة لحالة الأحرف (case-sensitive)<br>
-        • تحتاج لتجميع في المرة الأولى (compilation)<br>
-        • تستخدم ; لإخفاء المخرجات
-        </p>
-        </div>
-        """, unsafe_allow_html=True)
-
-# Section 2: Basics
-elif menu == "📝 الأساسيات":
-    st.markdown("## 📝 الأساسيات في Julia")
-
-    st.markdown("""
-    <div class='info-box'>
-    <h3>القواعد الأساسية:</h3>
-    <ul style='font-size: 1.1rem; line-height: 1.8;'>
-    <li>📌 استخدم <code>=</code> لتعيين القيم للمتغيرات</li>
-    <li>📌 استخدم <code>#</code> للتعليقات في سطر واحد</li>
-    <li>📌 استخدم <code>println()</code> للطباعة</li>
-    <li>📌 لا حاجة لنقطة فاصلة في نهاية السطر (اختيارية)</li>
-    <li>📌 استخدم <code>;</code> لإخفاء المخرجات</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-    examples = {
-        "المتغيرات الأساسية": {
-            "code": """# تعريف المتغيرات
-x = 10
-y = 20
-اسم = "محمد"  # Julia تدعم العربية!
-π_value = 3.14159
-
-println("قيمة x: ", x)
-println("قيمة y: ", y)
-println("الاسم: ", اسم)
-println("قيمة π: ", π_value)""",
-            "output": """قيمة x: 10
-قيمة y: 20
-الاسم: محمد
-قيمة π: 3.14159""",
-            "rules": """✅ القواعد:
-• أسماء المتغيرات يمكن أن تحتوي على أحرف عربية
-• يمكن استخدام الرموز الخاصة مثل π
-• لا تبدأ المتغير برقم
-• تجنب الكلمات المحجوزة (if, for, while, etc.)"""
-        },
-
-        "العمليات الأساسية": {
-            "code": """# عمليات حسابية بسيطة
-a = 15
-b = 4
-
-جمع = a + b
-طرح = a - b
-ضرب = a * b
-قسمة = a / b
-باقي_القسمة = a % b
-أس = a ^ 2
-
-println("الجمع: ", جمع)
-println("الطرح: ", طرح)
-println("الضرب: ", ضرب)
-println("القسمة: ", قسمة)
-println("باقي القسمة: ", باقي_القسمة)
-println("التربيع: ", أس)""",
-            "output": """الجمع: 19
-الطرح: 11
-الضرب: 60
-القسمة: 3.75
-باقي القسمة: 3
-التربيع: 225""",
-            "rules": """✅ القواعد:
-• + للجمع
-• - للطرح
-• * للضرب
-• / للقسمة
-• % لباقي القسمة
-• ^ للأس"""
-        },
-
-        "النصوص (Strings)": {
-            "code": """# التعامل مع النصوص
-اسم_أول = "أحمد"
-اسم_عائلة = "محمود"
-
-# دمج النصوص
-اسم_كامل = اسم_أول * " " * اسم_عائلة
-println("الاسم الكامل: ", اسم_كامل)
-
-# طول النص
-println("عدد الأحرف: ", length(اسم_كامل))
-
-# تكرار النص
-println("التكرار: ", اسم_أول ^ 3)""",
-            "output": """الاسم الكامل: أحمد محمود
-عدد الأحرف: 10
-التكرار: أحمدأحمدأحمد""",
-            "rules": """✅ القواعد:
-• استخدم "" أو '' للنصوص
-• * لدمج النصوص
-• ^ لتكرار النص
-• length() لحساب الطول"""
-        }
-    }
-
-    for title, content in examples.items():
-        with st.expander(f"### {title}", expanded=True):
-            col1, col2 = st.columns([1, 1])
-
-            with col1:
-                st.markdown("**الكود:**")
-                st.code(content["code"], language="julia")
-
-                if st.button(f"▶️ تشغيل", key=f"run_{title}"):
-                    st.success("تم التشغيل!")
-
-            with col2:
-                st.markdown("**المخرجات:**")
-                st.markdown(f"<div class='output-block'><pre>{content['output']}</pre></div>", unsafe_allow_html=True)
-
-                st.markdown("**القواعد:**")
-                st.markdown(f"<div class='info-box'>{content['rules']}</div>", unsafe_allow_html=True)
-
-# Section 3: Data Types
-elif menu == "🔢 أنواع البيانات":
-    st.markdown("## 🔢 أنواع البيانات في Julia")
-
-    st.markdown("""
-    <div class='info-box'>
-    <h3>أنواع البيانات الرئيسية:</h3>
-    <p style='font-size: 1.1rem;'>
-    Julia لغة مكتوبة ديناميكياً (dynamically typed) لكنها قوية في التعامل مع الأنواع
-    </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Create visualization
-    data_types = {
-        'النوع': ['Int64', 'Float64', 'String', 'Bool', 'Array', 'Dict'],
-        'الوصف': ['أعداد صحيحة', 'أعداد عشرية', 'نصوص', 'منطقية', 'مصفوفات', 'قواميس'],
-        'مثال': ['42', '3.14', '"نص"', 'true', '[1,2,3]', 'Dict("a"=>1)'],
-        'الاستخدام الاقتصادي': ['عدد الوحدات', 'السعر', 'اسم المنتج', 'قرار شراء', 'سلسلة زمنية', 'بيانات مركبة']
-    }
-
-    df = pd.DataFrame(data_types)
-
-    fig = go.Figure(data=[go.Table(
-        header=dict(
-            values=list(df.columns),
-            fill_color='#667eea',
-            align='center',
-            font=dict(color='white', size=14, family='Arial'),
-            height=40
-        ),
-        cells=dict(
-            values=[df[col] for col in df.columns],
-            fill_color=[['#f7fafc', '#e2e8f0'] * 3],
-            align='center',
-            font=dict(color='#2d3748', size=12, family='Arial'),
-            height=35
-        )
-    )])
-
-    fig.update_layout(
-        title=dict(text='جدول أنواع البيانات', font=dict(size=20)),
-        height=400
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
-
-    examples = {
-        "الأعداد الصحيحة (Integers)": {
-            "code": """# الأعداد الصحيحة
-عدد_الطلاب = 100
-سنة = 2024
-
-println("عدد الطلاب: ", عدد_الطلاب)
-println("نوع البيانات: ", typeof(عدد_الطلاب))
-println("السنة: ", سنة)
-
-# التحويل
-عدد_نصي = "250"
-عدد_محول = parse(Int64, عدد_نصي)
-println("بعد التحويل: ", عدد_محول)""",
-            "output": """عدد الطلاب: 100
-نوع البيانات: Int64
-السنة: 2024
-بعد التحويل: 250""",
-            "rules": """✅ القواعد:
-• Int8, Int16, Int32, Int64 (حسب الحجم)
-• استخدم typeof() للتحقق من النوع
-• parse() للتحويل من نص
-• ⚠️ خطأ: overflow عند تجاوز الحد الأقصى"""
-        },
-
-        "الأعداد العشرية (Floats)": {
-            "code": """# الأعداد العشرية
-سعر = 99.99
-معدل_نمو = 0.05
-معدل_فائدة = 3.5
-
-println("السعر: ", سعر)
-println("نوع البيانات: ", typeof(سعر))
-println("معدل النمو: ", معدل_نمو * 100, "%")
-
-# عمليات رياضية
-ضريبة = سعر * 0.15
-println("الضريبة: ", round(ضريبة, digits=2))""",
-            "output": """السعر: 99.99
-نوع البيانات: Float64
-معدل النمو: 5.0%
-الضريبة: 15.0""",
-            "rules": """✅ القواعد:
-• Float32, Float64 (دقة مزدوجة)
-• round() للتقريب
-• digits= لتحديد عدد الخانات العشرية
-• ⚠️ خطأ: precision errors في العمليات"""
-        },
-
-        "القيم المنطقية (Boolean)": {
-            "code": """# القيم المنطقية
-هل_طالب = true
-مسجل = false
-عمر = 20
-
-# المقارنات
-بالغ = عمر >= 18
-println("بالغ؟ ", بالغ)
-println("نوع البيانات: ", typeof(بالغ))
-
-# العمليات المنطقية
-مؤهل = هل_طالب && بالغ  # AND
-println("مؤهل للمنحة؟ ", مؤهل)
-
-يمكن_التسجيل = هل_طالب || مسجل  # OR
-println("يمكن التسجيل؟ ", يمكن_التسجيل)""",
-            "output": """بالغ؟ true
-نوع البيانات: Bool
-مؤهل للمنحة؟ true
-يمكن التسجيل؟ true""",
-            "rules": """✅ القواعد:
-• true و false فقط
-• && للعملية AND
-• || للعملية OR
-• ! للنفي (NOT)
-• ==, !=, <, >, <=, >= للمقارنات"""
-        },
-
-        "المصفوفات (Arrays)": {
-            "code": """# المصفوفات
-أسعار = [10.5, 20.3, 15.7, 30.2]
-أعوام = [2020, 2021, 2022, 2023]
-
-println("الأسعار: ", أسعار)
-println("نوع البيانات: ", typeof(أسعار))
-println("عدد العناصر: ", length(أسعار))
-
-# الوصول للعناصر (الترقيم يبدأ من 1)
-println("أول سعر: ", أسعار[1])
-println("آخر سعر: ", أسعار[end])
-
-# العمليات
-متوسط = sum(أسعار) / length(أسعار)
-println("المتوسط: ", round(متوسط, digits=2))""",
-            "output": """الأسعار: [10.5, 20.3, 15.7, 30.2]
-نوع البيانات: Vector{Float64}
-عدد العناصر: 4
-أول سعر: 10.5
-آخر سعر: 30.2
-المتوسط: 19.18""",
-            "rules": """✅ القواعد:
-• الترقيم يبدأ من 1 (مهم جداً!)
-• [] لإنشاء المصفوفة
-• [i] للوصول للعنصر
-• end للعنصر الأخير
-• push!() للإضافة
-• ⚠️ خطأ: BoundsError عند تجاوز الحدود"""
-        },
-
-        "القواميس (Dictionaries)": {
-            "code": """# القواميس
-بيانات_اقتصادية = Dict(
-    "الناتج_المحلي" => 500.5,
-    "التضخم" => 2.5,
-    "البطالة" => 5.2
-)
-
-println("البيانات: ", بيانات_اقتصادية)
-println("معدل التضخم: ", بيانات_اقتصادية["التضخم"], "%")
-
-# إضافة عنصر جديد
-بيانات_اقتصادية["الفائدة"] = 3.0
-println("بعد الإضافة: ", بيانات_اقتصادية)
-
-# التحقق من وجود مفتاح
-println("هل يوجد الناتج المحلي؟ ", haskey(بيانات_اقتصادية, "الناتج_المحلي"))""",
-            "output": """البيانات: Dict("الناتج_المحلي" => 500.5, "التضخم" => 2.5, "البطالة" => 5.2)
-معدل التضخم: 2.5%
-بعد الإضافة: Dict("الناتج_المحلي" => 500.5, "التضخم" => 2.5, "البطالة" => 5.2, "الفائدة" => 3.0)
-هل يوجد الناتج المحلي؟ true""",
-            "rules": """✅ القواعد:
-• Dict() لإنشاء قاموس
-• => للربط بين المفتاح والقيمة
-• [] للوصول والإضافة
-• haskey() للتحقق
-• keys() للمفاتيح، values() للقيم"""
-        }
-    }
-
-    for title, content in examples.items():
-        with st.expander(f"### {title}", expanded=False):
-            col1, col2 = st.columns([1, 1])
-
-            with col1:
-                st.markdown("**الكود:**")
-                st.code(content["code"], language="julia")
-
-                if st.button(f"▶️ تشغيل", key=f"run_{title}"):
-                    st.success("تم التشغيل!")
-
-            with col2:
-                st.markdown("**المخرجات:**")
-                st.markdown(f"<div class='output-block'><pre>{content['output']}</pre></div>", unsafe_allow_html=True)
-
-                st.markdown("**القواعد:**")
-                st.markdown(f"<div class='info-box'>{content['rules']}</div>", unsafe_allow_html=True)
-
-# Section 4: Arithmetic Operations
-elif menu == "➕ العمليات الحسابية":
-    st.markdown("## ➕ العمليات الحسابية المتقدمة")
-
-    st.markdown("""
-    <div class='info-box'>
-    <h3>العمليات الحسابية الأساسية والمتقدمة:</h3>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Interactive calculator
-    st.markdown("### 🧮 آلة حاسبة تفاعلية")
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        num1 = st.number_input("الرقم الأول", value=100.0, key="calc_num1")
-    with col2:
-        operation = st.selectbox("العملية", ["+", "-", "*", "/", "^", "%", "//"], key="calc_op")
-    with col3:
-        num2 = st.number_input("الرقم الثاني", value=20.0, key="calc_num2")
-
-    if st.button("احسب"):
-        if operation == "+":
-            result = num1 + num2
-            op_name = "الجمع"
-        elif operation == "-":
-            result = num1 - num2
-            op_name = "الطرح"
-        elif operation == "*":
-            result = num1 * num2
-            op_name = "الضرب"
-        elif operation == "/":
-            if num2 != 0:
-                result = num1 / num2
-                op_name = "القسمة"
-            else:
-                st.error("⚠️ خطأ: لا يمكن القسمة على صفر!")
-                result = None
-        elif operation == "^":
-            result = num1 ** num2
-            op_name = "الأس"
-        elif operation == "%":
-            result = num1 % num2
-            op_name = "باقي القسمة"
-        elif operation == "//":
-            result = num1 // num2
-            op_name = "القسمة الصحيحة"
-
-        if result is not None:
-            st.success(f"### نتيجة {op_name}: {result:.2f}")
-
-    st.markdown("---")
-
-    examples = {
-        "العمليات الحسابية الأساسية": {
-            "code": """# عمليات حسابية على متغيرات اقتصادية
-رأس_المال = 10000
-معدل_الفائدة = 0.05
-عدد_السنوات = 3
-
-# حساب الفائدة البسيطة
-فائدة_بسيطة = رأس_المال * معدل_الفائدة * عدد_السنوات
-println("الفائدة البسيطة: ", فائدة_بسيطة)
-
-# حساب الفائدة المركبة
-فائدة_مركبة = رأس_المال * (1 + معدل_الفائدة)^عدد_السنوات
-println("المبلغ بالفائدة المركبة: ", round(فائدة_مركبة, digits=2))
-
-# الربح
-ربح = فائدة_مركبة - رأس_المال
-println("الربح: ", round(ربح, digits=2))""",
-            "output": """الفائدة البسيطة: 1500.0
-المبلغ بالفائدة المركبة: 11576.25
-الربح: 1576.25""",
-            "rules": """✅ القواعد:
-• + للجمع
-• - للطرح  
-• * للضرب
-• / للقسمة
-• ^ للأس (الفائدة المركبة)
-• round() للتقريب"""
-        },
-
-        "الدوال الرياضية": {
-            "code": """# الدوال الرياضية المفيدة للاقتصاديين
-قيمة = -15.7
-
-# القيمة المطلقة
-مطلقة = abs(قيمة)
-println("القيمة المطلقة: ", مطلقة)
-
-# الجذر التربيعي
-جذر = sqrt(100)
-println("الجذر التربيعي لـ 100: ", جذر)
-
-# اللوغاريتم (مهم في النماذج الاقتصادية)
-لوغاريتم = log(100)  # Natural log
-println("اللوغاريتم الطبيعي: ", round(لوغاريتم, digits=2))
-
-# الأسي
-أسي = exp(2)
-println("e^2: ", round(أسي, digits=2))
-
-# الحد الأقصى والأدنى
-أرقام = [45, 23, 67, 12, 89]
-println("الحد الأقصى: ", maximum(أرقام))
-println("الحد الأدنى: ", minimum(أرقام))""",
-            "output": """القيمة المطلقة: 15.7
-الجذر التربيعي لـ 100: 10.0
-اللوغاريتم الطبيعي: 4.61
-e^2: 7.39
-الحد الأقصى: 89
-الحد الأدنى: 12""",
-            "rules": """✅ القواعد:
-• abs() للقيمة المطلقة
-• sqrt() للجذر التربيعي
-• log() للوغاريتم الطبيعي
-• log10() للوغاريتم العشري
-• exp() للأسي
-• maximum(), minimum()
-• ⚠️ خطأ: DomainError عند جذر عدد سالب"""
-        },
-
-        "الإحصاء الأساسي": {
-            "code": """# إحصاءات أساسية للبيانات الاقتصادية
-using Statistics  # تحميل مكتبة الإحصاء
-
-مبيعات = [120, 135, 142, 128, 155, 148, 162, 139]
-
-# المتوسط الحسابي
-متوسط = mean(مبيعات)
-println("المتوسط: ", round(متوسط, digits=2))
-
-# الوسيط
-وسيط = median(مبيعات)
-println("الوسيط: ", وسيط)
-
-# الانحراف المعياري
-انحراف = std(مبيعات)
-println("الانحراف المعياري: ", round(انحراف, digits=2))
-
-# التباين
-تباين = var(مبيعات)
-println("التباين: ", round(تباين, digits=2))
-
-# المجموع
-مجموع = sum(مبيعات)
-println("إجمالي المبيعات: ", مجموع)""",
-            "output": """المتوسط: 141.12
-الوسيط: 140.5
-الانحراف المعياري: 13.85
-التباين: 191.84
-إجمالي المبيعات: 1129""",
-            "rules": """✅ القواعد:
-• using Statistics للإحصاء
-• mean() للمتوسط
-• median() للوسيط
-• std() للانحراف المعياري
-• var() للتباين
-• sum() للمجموع
-• length() لعدد العناصر"""
-        },
-
-        "عمليات المصفوفات": {
-            "code": """# العمليات على المصفوفات
-أسعار = [100, 150, 200, 120]
-كميات = [5, 3, 2, 8]
-
-# الضرب element-wise
-إيرادات = أسعار .* كميات  # لاحظ النقطة .
-println("الإيرادات: ", إيرادات)
-
-# الجمع على جميع العناصر
-إيرادات_كلية = sum(إيرادات)
-println("الإيرادات الكلية: ", إيرادات_كلية)
-
-# تطبيق خصم 10%
-خصم = 0.10
-أسعار_بعد_خصم = أسعار .* (1 - خصم)
-println("الأسعار بعد الخصم: ", أسعار_بعد_خصم)
-
-# إضافة ضريبة 15%
-ضريبة = 0.15
-أسعار_نهائية = أسعار_بعد_خصم .* (1 + ضريبة)
-println("الأسعار النهائية: ", round.(أسعار_نهائية, digits=2))""",
-            "output": """الإيرادات: [500, 450, 400, 960]
-الإيرادات الكلية: 2310
-الأسعار بعد الخصم: [90.0, 135.0, 180.0, 108.0]
-الأسعار النهائية: [103.5, 155.25, 207.0, 124.2]""",
-            "rules": """✅ القواعد:
-• استخدم . قبل العملية للتطبيق على جميع العناصر
-• .* للضرب element-wise
-• ./ للقسمة element-wise
-• .+ للجمع element-wise
-• .^ للأس element-wise
-• round.() للتقريب على كل العناصر"""
-        }
-    }
-
-    for title, content in examples.items():
-        with st.expander(f"### {title}", expanded=False):
-            col1, col2 = st.columns([1, 1])
-
-            with col1:
-                st.markdown("**الكود:**")
-                st.code(content["code"], language="julia")
-
-                if st.button(f"▶️ تشغيل", key=f"run_{title}"):
-                    st.success("تم التشغيل!")
-
-            with col2:
-                st.markdown("**المخرجات:**")
-                st.markdown(f"<div class='output-block'><pre>{content['output']}</pre></div>", unsafe_allow_html=True)
-
-                st.markdown("**القواعد:**")
-                st.markdown(f"<div class='info-box'>{content['rules']}</div>", unsafe_allow_html=True)
-
-# Section 5: Loops
-elif menu == "🔄 الحلقات التكرارية":
-    st.markdown("## 🔄 الحلقات التكرارية (Loops)")
-
-    st.markdown("""
-    <div class='info-box'>
-    <h3>أنواع الحلقات في Julia:</h3>
-    <ul style='font-size: 1.1rem; line-height: 1.8;'>
-    <li>🔁 <strong>for loop:</strong> للتكرار عدد محدد من المرات</li>
-    <li>🔁 <strong>while loop:</strong> للتكرار طالما الشرط صحيح</li>
-    <li>🔁 <strong>break:</strong> للخروج من الحلقة</li>
-    <li>🔁 <strong>continue:</strong> لتجاوز التكرار الحالي</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-    examples = {
-        "حلقة for الأساسية": {
-            "code": """# حلقة for بسيطة
-println("طباعة الأعداد من 1 إلى 5:")
-for i in 1:5
-    println("العدد: ", i)
-end
-
-# حلقة على مصفوفة
-مدن = ["الرياض", "جدة", "الدمام", "مكة"]
-println("\\nالمدن:")
-for مدينة in مدن
-    println("- ", مدينة)
-end
-
-# حلقة بخطوة محددة
-println("\\nالأعداد الزوجية من 0 إلى 10:")
-for i in 0:2:10
-    println(i)
-end""",
-            "output": """طباعة الأعداد من 1 إلى 5:
-العدد: 1
-العدد: 2
-العدد: 3
-العدد: 4
-العدد: 5
-
-المدن:
-- الرياض
-- جدة
-- الدمام
-- مكة
-
-الأعداد الزوجية من 0 إلى 10:
-0
-2
-4
-6
-8
-10""",
-            "rules": """✅ القواعد:
-• for متغير in نطاق
-• 1:5 يعني من 1 إلى 5
-• 0:2:10 يعني من 0 إلى 10 بخطوة 2
-• end لإنهاء الحلقة
-• ⚠️ خطأ: نسيان end"""
-        },
-
-        "تطبيق اقتصادي: حساب الفائدة المركبة": {
-            "code": """# حساب نمو رأس المال عبر السنين
-رأس_المال_الأولي = 10000
-معدل_الفائدة = 0.08  # 8%
-عدد_السنوات = 10
-
-println("نمو رأس المال:")
-println("السنة\\tالمبلغ")
-println("----\\t------")
-
-رأس_المال = رأس_المال_الأولي
-for سنة in 1:عدد_السنوات
-    رأس_المال = رأس_المال * (1 + معدل_الفائدة)
-    println(سنة, "\\t", round(رأس_المال, digits=2))
-end
-
-ربح_إجمالي = رأس_المال - رأس_المال_الأولي
-println("\\nالربح الإجمالي: ", round(ربح_إجمالي, digits=2))""",
-            "output": """نمو رأس المال:
-السنة	المبلغ
-----	------
-1	10800.0
-2	11664.0
-3	12597.12
-4	13604.89
-5	14693.28
-6	15868.74
-7	17138.24
-8	18509.3
-9	19990.05
-10	21589.25
-
-الربح الإجمالي: 11589.25""",
-            "rules": """✅ القواعد:
-• استخدم حلقة for للعمليات المتكررة
-• قم بتحديث المتغير داخل الحلقة
-• round() للتقريب في كل تكرار
-• \\t للمسافة البادئة (tab)"""
-        },
-
-        "حلقة while": {
-            "code": """# حلقة while - حتى تصل للهدف
-هدف_ادخار = 50000
-رصيد = 0
-ادخار_شهري = 2000
-شهر = 0
-
-println("خطة الادخار:")
-while رصيد < هدف_ادخار
-    شهر += 1
-    رصيد += ادخار_شهري
-    println("الشهر ", شهر, ": الرصيد = ", رصيد)
-
-    # إيقاف في حال تجاوز 30 شهر (أمان)
-    if شهر >= 30
-        println("تحذير: تجاوزت 30 شهر!")
-        break
-    end
-end
-
-println("\\nوصلت للهدف في ", شهر, " شهر")""",
-            "output": """خطة الادخار:
-الشهر 1: الرصيد = 2000
-الشهر 2: الرصيد = 4000
-الشهر 3: الرصيد = 6000
-...
-الشهر 24: الرصيد = 48000
-الشهر 25: الرصيد = 50000
-
-وصلت للهدف في 25 شهر""",
-            "rules": """✅ القواعد:
-• while شرط
-• الشرط يُفحص قبل كل تكرار
-• استخدم break للخروج
-• += للزيادة
-• ⚠️ خطأ: حلقة لا نهائية إذا لم يتغير الشرط"""
-        },
-
-        "استخدام break و continue": {
-            "code": """# البحث عن أول سعر يتجاوز 150
-أسعار = [100, 120, 145, 160, 180, 155]
-
-println("البحث عن أول سعر > 150:")
-for (index, سعر) in enumerate(أسعار)
-    if سعر <= 150
-        continue  # تجاوز السعر المنخفض
-    end
-
-    println("وجدت! السعر ", سعر, " في الموضع ", index)
-    break  # توقف عند أول سعر
-end
-
-println("\\nطباعة الأسعار (تجاهل القيم السالبة):")
-أسعار_مع_سالب = [100, -50, 120, -30, 150]
-for سعر in أسعار_مع_سالب
-    if سعر < 0
-        continue  # تجاوز القيم السالبة
-    end
-    println("سعر صحيح: ", سعر)
-end""",
-            "output": """البحث عن أول سعر > 150:
-وجدت! السعر 160 في الموضع 4
-
-طباعة الأسعار (تجاهل القيم السالبة):
-سعر صحيح: 100
-سعر صحيح: 120
-سعر صحيح: 150""",
-            "rules": """✅ القواعد:
-• break للخروج من الحلقة فوراً
-• continue لتجاوز التكرار الحالي
-• enumerate() للحصول على الفهرس والقيمة
-• مفيد في البحث والتصفية"""
-        },
-
-        "حلقات متداخلة (Nested Loops)": {
-            "code": """# جدول ضرب بسيط (3x3)
-println("جدول الضرب:")
-for i in 1:3
-    for j in 1:3
-        نتيجة = i * j
-        print(i, " × ", j, " = ", نتيجة, "\\t")
-    end
-    println()  # سطر جديد
-end
-
-# حساب المبيعات لعدة منتجات وفروع
-منتجات = ["منتج A", "منتج B"]
-فروع = ["الفرع 1", "الفرع 2"]
-أسعار = [100, 150]
-
-println("\\nتقرير المبيعات:")
-for (i, منتج) in enumerate(منتجات)
-    for (j, فرع) in enumerate(فروع)
-        مبيعات = أسعار[i] * (i + j)  # صيغة مبسطة
-        println(منتج, " في ", فرع, ": ", مبيعات)
-    end
-end""",
-            "output": """جدول الضرب:
-1 × 1 = 1	1 × 2 = 2	1 × 3 = 3	
-2 × 1 = 2	2 × 2 = 4	2 × 3 = 6	
-3 × 1 = 3	3 × 2 = 6	3 × 3 = 9	
-
-تقرير المبيعات:
-منتج A في الفرع 1: 200
-منتج A في الفرع 2: 300
-منتج B في الفرع 1: 450
-منتج B في الفرع 2: 600""",
-            "rules": """✅ القواعد:
-• يمكن تداخل حلقات for
-• الحلقة الداخلية تكتمل بالكامل لكل تكرار من الخارجية
-• print() للطباعة بدون سطر جديد
-• println() للطباعة مع سطر جديد
-• enumerate() للفهرسة"""
-        }
-    }
-
-    for title, content in examples.items():
-        with st.expander(f"### {title}", expanded=False):
-            col1, col2 = st.columns([1, 1])
-
-            with col1:
-                st.markdown("**الكود:**")
-                st.code(content["code"], language="julia")
-
-                if st.button(f"▶️ تشغيل", key=f"run_{title}"):
-                    st.success("تم التشغيل!")
-
-            with col2:
-                st.markdown("**المخرجات:**")
-                st.markdown(f"<div class='output-block'><pre>{content['output']}</pre></div>", unsafe_allow_html=True)
-
-                st.markdown("**القواعد:**")
-                st.markdown(f"<div class='info-box'>{content['rules']}</div>", unsafe_allow_html=True)
-
-# Section 6: Conditionals
-elif menu == "⚖️ الشروط":
-    st.markdown("## ⚖️ الشروط والجمل الشرطية")
-
-    st.markdown("""
-    <div class='info-box'>
-    <h3>أنواع الجمل الشرطية:</h3>
-    <ul style='font-size: 1.1rem; line-height: 1.8;'>
-    <li>✅ <strong>if:</strong> تنفيذ كود إذا كان الشرط صحيح</li>
-    <li>✅ <strong>elseif:</strong> شرط بديل</li>
-    <li>✅ <strong>else:</strong> تنفيذ إذا فشلت جميع الشروط</li>
-    <li>✅ <strong>العمليات المنطقية:</strong> &&، ||، !</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Interactive condition tester
-    st.markdown("### 🧪 اختبار الشروط التفاعلي")
-
-    col1, col2 = st.columns(2)
-    with col1:
-        دخل = st.number_input("الدخل الشهري", min_value=0, value=5000, step=500)
-        نفقات = st.number_input("النفقات الشهرية", min_value=0, value=3000, step=500)
-
-    with col2:
-        st.markdown("### النتيجة:")
-        صافي = دخل - نفقات
-
-        if صافي > 2000:
-            st.success(f"✅ ممتاز! لديك فائض: {صافي}")
-            st.info("يمكنك الادخار والاستثمار")
-        elif صافي > 0:
-            st.warning(f"⚠️ جيد! لديك فائض صغير: {صافي}")
-            st.info("حاول زيادة الادخار")
-        else:
-            st.error(f"❌ تحذير! لديك عجز: {صافي}")
-            st.info("راجع نفقاتك")
-
-    st.markdown("---")
-
-    examples = {
-        "الشروط البسيطة (if)": {
-            "code": """# شرط بسيط
-سعر = 150
-
-if سعر > 100
-    println("السعر مرتفع")
-end
-
-# شرط مع else
-عمر = 17
-
-if عمر >= 18
-    println("بالغ - يمكنه التصويت")
-else
-    println("قاصر - لا يمكنه التصويت")
-end
-
-# شرط متعدد مع elseif
-درجة = 85
-
-if درجة >= 90
-    println("ممتاز: A")
-elseif درجة >= 80
-    println("جيد جداً: B")
-elseif درجة >= 70
-    println("جيد: C")
-else
-    println("مقبول أو راسب")
-end""",
-            "output": """السعر مرتفع
-قاصر - لا يمكنه التصويت
-جيد جداً: B""",
-            "rules": """✅ القواعد:
-• if شرط ... end
-• elseif للشروط الإضافية
-• else للحالة الافتراضية
-• يُفحص الشرط بالترتيب
-• أول شرط صحيح يُنفذ فقط
-• ⚠️ خطأ: نسيان end"""
-        },
-
-        "عمليات المقارنة": {
-            "code": """# عمليات المقارنة
-a = 10
-b = 20
-
-println("a == b: ", a == b)  # يساوي
-println("a != b: ", a != b)  # لا يساوي
-println("a < b: ", a < b)    # أصغر من
-println("a > b: ", a > b)    # أكبر من
-println("a <= b: ", a <= b)  # أصغر أو يساوي
-println("a >= b: ", a >= b)  # أكبر أو يساوي
-
-# مثال اقتصادي
-سعر_السوق = 95
-سعر_التكلفة = 80
-
-if سعر_السوق > سعر_التكلفة
-    ربح = سعر_السوق - سعر_التكلفة
-    println("\\nهناك ربح: ", ربح)
-elseif سعر_السوق == سعر_التكلفة
-    println("\\nلا ربح ولا خسارة")
-else
-    خسارة = سعر_التكلفة - سعر_السوق
-    println("\\nهناك خسارة: ", خسارة)
-end""",
-            "output": """a == b: false
-a != b: true
-a < b: true
-a > b: false
-a <= b: true
-a >= b: false
-
-هناك ربح: 15""",
-            "rules": """✅ القواعد:
-• == للتساوي
-• != لعدم التساوي
-• <، >، <=، >= للمقارنات
-• النتيجة دائماً true أو false
-• يمكن استخدامها في if"""
-        },
-
-        "العمليات المنطقية (AND، OR، NOT)": {
-            "code": """# العمليات المنطقية
-دخل = 6000
-عمر = 25
-لديه_وظيفة = true
-
-# AND (&&) - يجب أن تكون جميع الشروط صحيحة
-if دخل > 5000 && عمر >= 21
-    println("مؤهل للقرض الكبير")
-end
-
-# OR (||) - يكفي شرط واحد صحيح
-if دخل > 8000 || لديه_وظيفة
-    println("مؤهل للقرض العادي")
-end
-
-# NOT (!) - عكس الشرط
-مسجل = false
-if !مسجل
-    println("يجب التسجيل أولاً")
-end
-
-# شروط مركبة
-ائتمان_ممتاز = true
-if (دخل > 5000 && عمر >= 21) || ائتمان_ممتاز
-    println("\\nحصل على أفضل سعر فائدة")
-end
-
-# مثال اقتصادي: قرار الاستثمار
-عائد_متوقع = 0.12  # 12%
-مخاطر = "منخفضة"
-مدة = 5  # سنوات
-
-if عائد_متوقع > 0.10 && مخاطر == "منخفضة" && مدة >= 3
-    println("\\nقرار الاستثمار: يُنصح بالاستثمار ✅")
-else
-    println("\\nقرار الاستثمار: ادرس الخيارات بعناية ⚠️")
-end""",
-            "output": """مؤهل للقرض الكبير
-مؤهل للقرض العادي
-يجب التسجيل أولاً
-
-حصل على أفضل سعر فائدة
-
-قرار الاستثمار: يُنصح بالاستثمار ✅""",
-            "rules": """✅ القواعد:
-• && للعملية AND (كل الشروط)
-• || للعملية OR (شرط واحد على الأقل)
-• ! للعملية NOT (النفي)
-• استخدم () لتجميع الشروط
-• الأولوية: ! ثم && ثم ||"""
-        },
-
-        "تطبيق: تصنيف الشركات": {
-            "code": """# تصنيف الشركات حسب الأداء
-إيرادات = 5_000_000  # يمكن استخدام _ للوضوح
-أرباح = 800_000
-نسبة_نمو = 0.15  # 15%
-عدد_موظفين = 150
-
-# حساب هامش الربح
-هامش_ربح = أرباح / إيرادات
-
-println("تقرير تصنيف الشركة")
-println("=" ^ 30)
-
-# التصنيف
-if هامش_ربح >= 0.20 && نسبة_نمو >= 0.15
-    تصنيف = "ممتاز - النجمة ⭐⭐⭐"
-elseif هامش_ربح >= 0.15 && نسبة_نمو >= 0.10
-    تصنيف = "جيد جداً - صاعدة ⭐⭐"
-elseif هامش_ربح >= 0.10 && نسبة_نمو >= 0.05
-    تصنيف = "جيد - مستقرة ⭐"
-elseif هامش_ربح >= 0.05
-    تصنيف = "مقبول - تحتاج تحسين ⚠️"
-else
-    تصنيف = "ضعيف - تحتاج إعادة هيكلة ❌"
-end
-
-println("هامش الربح: ", round(هامش_ربح * 100, digits=2), "%")
-println("نسبة النمو: ", round(نسبة_نمو * 100, digits=2), "%")
-println("عدد الموظفين: ", عدد_موظفين)
-println("\\nالتصنيف: ", تصنيف)
-
-# توصيات
-println("\\nالتوصيات:")
-if هامش_ربح < 0.10
-    println("• ركز على زيادة الأرباح")
-end
-if نسبة_نمو < 0.05
-    println("• خطط لاستراتيجيات النمو")
-end
-if عدد_موظفين > 200
-    println("• راجع الكفاءة التشغيلية")
-end""",
-            "output": """تقرير تصنيف الشركة
-==============================
-هامش الربح: 16.0%
-نسبة النمو: 15.0%
-عدد الموظفين: 150
-
-التصنيف: جيد جداً - صاعدة ⭐⭐
-
-التوصيات:""",
-            "rules": """✅ القواعد:
-• يمكن استخدام _ في الأرقام للوضوح
-• "=" ^ 30 لتكرار الرمز 30 مرة
-• اجمع الشروط المنطقية بذكاء
-• استخدم متغير للتصنيف
-• أضف توصيات حسب الشروط"""
-        },
-
-        "الشرط الثلاثي (Ternary Operator)": {
-            "code": """# الشرط الثلاثي: شرط ? إذا_صحيح : إذا_خطأ
-سعر = 120
-
-# طريقة عادية
-if سعر > 100
-    حالة = "مرتفع"
-else
-    حالة = "منخفض"
-end
-println("الطريقة العادية: ", حالة)
-
-# الشرط الثلاثي (أقصر)
-حالة_ثلاثي = سعر > 100 ? "مرتفع" : "منخفض"
-println("الشرط الثلاثي: ", حالة_ثلاثي)
-
-# مثال: حساب الخصم
-كمية = 15
-خصم = كمية >= 10 ? 0.15 : 0.05
-println("\\nالكمية: ", كمية)
-println("نسبة الخصم: ", خصم * 100, "%")
-
-سعر_نهائي = سعر * (1 - خصم)
-println("السعر بعد الخصم: ", round(سعر_نهائي, digits=2))
-
-# شرط ثلاثي متداخل (تجنب التعقيد)
-درجة = 75
-مستوى = درجة >= 90 ? "ممتاز" : 
-         درجة >= 70 ? "جيد" : "مقبول"
-println("\\nالمستوى: ", مستوى)""",
-            "output": """الطريقة العادية: مرتفع
-الشرط الثلاثي: مرتفع
-
-الكمية: 15
-نسبة الخصم: 15.0%
-السعر بعد الخصم: 102.0
-
-المستوى: جيد""",
-            "rules": """✅ القواعد:
-• الصيغة: شرط ? قيمة_إذا_صحيح : قيمة_إذا_خطأ
-• مفيد للتعيينات البسيطة
-• أقصر من if-else
-• تجنب التداخل الكثير (يصعب القراءة)
-• استخدمه للشروط البسيطة فقط"""
-        }
-    }
-
-    for title, content in examples.items():
-        with st.expander(f"### {title}", expanded=False):
-            col1, col2 = st.columns([1, 1])
-
-            with col1:
-                st.markdown("**الكود:**")
-                st.code(content["code"], language="julia")
-
-                if st.button(f"▶️ تشغيل", key=f"run_{title}"):
-                    st.success("تم التشغيل!")
-
-            with col2:
-                st.markdown("**المخرجات:**")
-                st.markdown(f"<div class='output-block'><pre>{content['output']}</pre></div>", unsafe_allow_html=True)
-
-                st.markdown("**القواعد:**")
-                st.markdown(f"<div class='info-box'>{content['rules']}</div>", unsafe_allow_html=True)
-
-# Section 7: Arrays and DataFrames
-elif menu == "📊 المصفوفات والجداول":
-    st.markdown("## 📊 المصفوفات والجداول (Arrays & DataFrames)")
-
-    st.markdown("""
-    <div class='info-box'>
-    <h3>العمل مع البيانات:</h3>
-    <ul style='font-size: 1.1rem; line-height: 1.8;'>
-    <li>📋 <strong>Arrays:</strong> مصفوفات أحادية ومتعددة الأبعاد</li>
-    <li>📊 <strong>DataFrames:</strong> جداول بيانات مثل Excel</li>
-    <li>🔧 <strong>Operations:</strong> عمليات على البيانات</li>
-    <li>📈 <strong>Analysis:</strong> تحليل البيانات الاقتصادية</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-    examples = {
-        "المصفوفات الأحادية (Vectors)": {
-            "code": """# إنشاء مصفوفة أحادية
-أسعار = [100, 150, 200, 175, 225]
-println("الأسعار: ", أسعار)
-
-# الوصول للعناصر (الترقيم من 1!)
-println("أول سعر: ", أسعار[1])
-println("آخر سعر: ", أسعار[end])
-println("السعر الثالث: ", أسعار[3])
-
-# تعديل عنصر
-أسعار[2] = 160
-println("بعد التعديل: ", أسعار)
-
-# إضافة عنصر
-push!(أسعار, 250)  # إضافة في النهاية
-println("بعد الإضافة: ", أسعار)
-
-# حذف آخر عنصر
-pop!(أسعار)
-println("بعد الحذف: ", أسعار)
-
-# معلومات المصفوفة
-println("\\nعدد العناصر: ", length(أسعار))
-println("النوع: ", typeof(أسعار))""",
-            "output": """الأسعار: [100, 150, 200, 175, 225]
-أول سعر: 100
-آخر سعر: 225
-السعر الثالث: 200
-بعد التعديل: [100, 160, 200, 175, 225]
-بعد الإضافة: [100, 160, 200, 175, 225, 250]
-بعد الحذف: [100, 160, 200, 175, 225]
-
-عدد العناصر: 5
-النوع: Vector{Int64}""",
-            "rules": """✅ القواعد:
-• [] لإنشاء مصفوفة
-• الترقيم يبدأ من 1 (مهم!)
-• [i] للوصول للعنصر
-• end للعنصر الأخير
-• push!() للإضافة في النهاية
-• pop!() لحذف من النهاية
-• ! تعني أن الدالة تغير المصفوفة
-• ⚠️ خطأ: BoundsError عند تجاوز الحدود"""
-        },
-
-        "عمليات على المصفوفات": {
-            "code": """# عمليات متقدمة على المصفوفات
-مبيعات = [120, 135, 142, 128, 155, 148]
-
-# الإحصاءات
-using Statistics
-
-println("المتوسط: ", round(mean(مبيعات), digits=2))
-println("الوسيط: ", median(مبيعات))
-println("الحد الأقصى: ", maximum(مبيعات))
-println("الحد الأدنى: ", minimum(مبيعات))
-println("المجموع: ", sum(مبيعات))
-
-# الفرز
-مبيعات_مرتبة = sort(مبيعات)
-println("\\nمرتبة تصاعدياً: ", مبيعات_مرتبة)
-
-مبيعات_تنازلي = sort(مبيعات, rev=true)
-println("مرتبة تنازلياً: ", مبيعات_تنازلي)
-
-# التصفية
-مبيعات_عالية = filter(x -> x > 140, مبيعات)
-println("\\nالمبيعات > 140: ", مبيعات_عالية)
-
-# التحويل (map)
-مبيعات_بالآلاف = map(x -> x / 1000, مبيعات)
-println("بالآلاف: ", مبيعات_بالآلاف)
-
-# الشرائح (slicing)
-أول_ثلاثة = مبيعات[1:3]
-println("\\nأول 3 أيام: ", أول_ثلاثة)""",
-            "output": """المتوسط: 138.0
-الوسيط: 138.5
-الحد الأقصى: 155
-الحد الأدنى: 120
-المجموع: 828
-
-مرتبة تصاعدياً: [120, 128, 135, 142, 148, 155]
-مرتبة تنازلياً: [155, 148, 142, 135, 128, 120]
-
-المبيعات > 140: [142, 155, 148]
-
-بالآلاف: [0.12, 0.135, 0.142, 0.128, 0.155, 0.148]
-
-أول 3 أيام: [120, 135, 142]""",
-            "rules": """✅ القواعد:
-• sort() للفرز (لا يغير الأصل)
-• sort!() للفرز (يغير الأصل)
-• rev=true للتنازلي
-• filter(شرط, مصفوفة) للتصفية
-• map(دالة, مصفوفة) للتحويل
-• [start:end] للشرائح
-• -> للدوال المجهولة (lambda)"""
-        },
-
-        "المصفوفات متعددة الأبعاد": {
-            "code": """# مصفوفة ثنائية الأبعاد (Matrix)
-# المبيعات لـ 3 منتجات في 4 أشهر
-مبيعات = [
-    120 135 142 128;  # منتج 1
-    90  95  88  92;   # منتج 2
-    150 145 160 155   # منتج 3
-]
-
-println("المصفوفة:")
-println(مبيعات)
-
-# الأبعاد
-println("\\nالأبعاد: ", size(مبيعات))
-println("عدد الصفوف: ", size(مبيعات, 1))
-println("عدد الأعمدة: ", size(مبيعات, 2))
-
-# الوصول للعناصر
-println("\\nمبيعات المنتج 1 في الشهر 2: ", مبيعات[1, 2])
-println("مبيعات المنتج 3 في الشهر 4: ", مبيعات[3, 4])
-
-# صف كامل (منتج)
-println("\\nمبيعات المنتج 2: ", مبيعات[2, :])
-
-# عمود كامل (شهر)
-println("مبيعات الشهر 3: ", مبيعات[:, 3])
-
-# مجموع كل منتج
-println("\\nإجمالي كل منتج:")
-for i in 1:size(مبيعات, 1)
-    إجمالي = sum(مبيعات[i, :])
-    println("المنتج ", i, ": ", إجمالي)
-end
-
-# مجموع كل شهر
-println("\\nإجمالي كل شهر:")
-for j in 1:size(مبيعات, 2)
-    إجمالي = sum(مبيعات[:, j])
-    println("الشهر ", j, ": ", إجمالي)
-end""",
-            "output": """المصفوفة:
-3×4 Matrix{Int64}:
- 120  135  142  128
-  90   95   88   92
- 150  145  160  155
-
-الأبعاد: (3, 4)
-عدد الصفوف: 3
-عدد الأعمدة: 4
-
-مبيعات المنتج 1 في الشهر 2: 135
-مبيعات المنتج 3 في الشهر 4: 155
-
-مبيعات المنتج 2: [90, 95, 88, 92]
-مبيعات الشهر 3: [142, 88, 160]
-
-إجمالي كل منتج:
-المنتج 1: 525
-المنتج 2: 365
-المنتج 3: 610
-
-إجمالي كل شهر:
-الشهر 1: 360
-الشهر 2: 375
-الشهر 3: 390
-الشهر 4: 375""",
-            "rules": """✅ القواعد:
-• مصفوفة ثنائية: [صف1; صف2; صف3]
-• أو بمسافات: [1 2; 3 4]
-• [i, j] للوصول لعنصر
-• [i, :] لصف كامل
-• [:, j] لعمود كامل
-• size() للأبعاد
-• الترقيم من 1 للصفوف والأعمدة"""
-        },
-
-        "DataFrames - الجداول": {
-            "code": """# العمل مع DataFrames (مثل Excel)
-using DataFrames
-
-# إنشاء DataFrame
-بيانات = DataFrame(
-    المنتج = ["قمح", "أرز", "شعير", "ذرة"],
-    السعر = [150.5, 180.0, 120.0, 140.5],
-    الكمية = [1000, 800, 1200, 950],
-    البلد = ["السعودية", "مصر", "الأردن", "السعودية"]
-)
-
-println("الجدول:")
-println(بيانات)
-
-# معلومات الجدول
-println("\\nعدد الصفوف: ", nrow(بيانات))
-println("عدد الأعمدة: ", ncol(بيانات))
-println("أسماء الأعمدة: ", names(بيانات))
-
-# الوصول لعمود
-println("\\nالأسعار: ", بيانات.السعر)
-# أو
-println("الأسعار (طريقة 2): ", بيانات[:, :السعر])
-
-# إضافة عمود جديد
-بيانات.الإيراد = بيانات.السعر .* بيانات.الكمية
-println("\\nبعد إضافة الإيراد:")
-println(بيانات)
-
-# التصفية
-println("\\nمنتجات السعودية:")
-سعودية = filter(row -> row.البلد == "السعودية", بيانات)
-println(سعودية)
-
-# الترتيب
-println("\\nمرتب حسب السعر:")
-مرتب = sort(بيانات, :السعر, rev=true)
-println(مرتب)
-
-# الإحصاءات
-println("\\nمتوسط السعر: ", round(mean(بيانات.السعر), digits=2))
-println("إجمالي الإيراد: ", sum(بيانات.الإيراد))""",
-            "output": """الجدول:
-4×4 DataFrame
- Row │ المنتج  السعر    الكمية  البلد      
-     │ String  Float64  Int64   String     
-─────┼─────────────────────────────────────
-   1 │ قمح      150.5     1000  السعودية
-   2 │ أرز      180.0      800  مصر
-   3 │ شعير     120.0     1200  الأردن
-   4 │ ذرة      140.5      950  السعودية
-
-عدد الصفوف: 4
-عدد الأعمدة: 4
-أسماء الأعمدة: ["المنتج", "السعر", "الكمية", "البلد"]
-
-الأسعار: [150.5, 180.0, 120.0, 140.5]
-الأسعار (طريقة 2): [150.5, 180.0, 120.0, 140.5]
-
-بعد إضافة الإيراد:
-[الجدول مع عمود الإيراد]
-
-منتجات السعودية:
-[الصفوف الخاصة بالسعودية]
-
-مرتب حسب السعر:
-[الجدول مرتباً]
-
-متوسط السعر: 147.75
-إجمالي الإيراد: 578975.0""",
-            "rules": """✅ القواعد:
-• using DataFrames لتحميل المكتبة
-• DataFrame() لإنشاء جدول
-• . للوصول للعمود
-• [:, :اسم] للوصول للعمود (طريقة بديلة)
-• filter() للتصفية
-• sort() للترتيب
-• nrow(), ncol() للعدد
-• أضف عمود: df.جديد = ...
-• ⚠️ استخدم .* للعمليات على الأعمدة"""
-        },
-
-        "تطبيق عملي: تحليل مبيعات": {
-            "code": """# تحليل شامل لبيانات مبيعات
-using DataFrames, Statistics
-
-# بيانات المبيعات
-مبيعات = DataFrame(
-    اليوم = 1:7,
-    المبيعات = [1200, 1350, 980, 1420, 1560, 1380, 1290],
-    التكاليف = [800, 900, 650, 950, 1040, 920, 860],
-    العملاء = [45, 52, 38, 55, 60, 53, 49]
-)
-
-# حساب الأرباح
-مبيعات.الربح = مبيعات.المبيعات .- مبيعات.التكاليف
-
-# حساب هامش الربح
-مبيعات.هامش_الربح = (مبيعات.الربح ./ مبيعات.المبيعات) .* 100
-
-# متوسط الإنفاق لكل عميل
-مبيعات.متوسط_العميل = مبيعات.المبيعات ./ مبيعات.العملاء
-
-println("تقرير المبيعات الأسبوعي")
-println("=" ^ 50)
-println(مبيعات)
-
-# الإحصاءات
-println("\\nالتحليل الإحصائي:")
-println("-" ^ 50)
-println("متوسط المبيعات اليومية: ", round(mean(مبيعات.المبيعات), digits=2))
-println("متوسط الربح اليومي: ", round(mean(مبيعات.الربح), digits=2))
-println("متوسط هامش الربح: ", round(mean(مبيعات.هامش_الربح), digits=2), "%")
-println("أعلى مبيعات: ", maximum(مبيعات.المبيعات))
-println("أقل مبيعات: ", minimum(مبيعات.المبيعات))
-
-# أفضل وأسوأ يوم
-أفضل_يوم = مبيعات[argmax(مبيعات.المبيعات), :]
-أسوأ_يوم = مبيعات[argmin(مبيعات.المبيعات), :]
-
-println("\\nأفضل يوم: اليوم ", أفضل_يوم.اليوم, " بمبيعات ", أفضل_يوم.المبيعات)
-println("أسوأ يوم: اليوم ", أسوأ_يوم.اليوم, " بمبيعات ", أسوأ_يوم.المبيعات)
-
-# الإجماليات
-println("\\nالإجماليات:")
-println("إجمالي المبيعات: ", sum(مبيعات.المبيعات))
-println("إجمالي الأرباح: ", sum(مبيعات.الربح))
-println("إجمالي العملاء: ", sum(مبيعات.العملاء))""",
-            "output": """تقرير المبيعات الأسبوعي
-==================================================
-7×7 DataFrame
- Row │ اليوم  المبيعات  التكاليف  العملاء  الربح  هامش_الربح  متوسط_العميل
-[الجدول الكامل]
-
-التحليل الإحصائي:
---------------------------------------------------
-متوسط المبيعات اليومية: 1311.43
-متوسط الربح اليومي: 454.29
-متوسط هامش الربح: 34.65%
-أعلى مبيعات: 1560
-أقل مبيعات: 980
-
-أفضل يوم: اليوم 5 بمبيعات 1560
-أسوأ يوم: اليوم 3 بمبيعات 980
-
-الإجماليات:
-إجمالي المبيعات: 9180
-إجمالي الأرباح: 3180
-إجمالي العملاء: 352""",
-            "rules": """✅ القواعد:
-• .- للطرح على كل العناصر
-• ./ للقسمة على كل العناصر
-• .* للضرب على كل العناصر
-• argmax() لموضع الأكبر
-• argmin() لموضع الأصغر
-• استخدم DataFrame للبيانات المهيكلة
-• احسب المؤشرات المهمة (هامش الربح، متوسطات)"""
-        }
-    }
-
-    for title, content in examples.items():
-        with st.expander(f"### {title}", expanded=False):
-            col1, col2 = st.columns([1, 1])
-
-            with col1:
-                st.markdown("**الكود:**")
-                st.code(content["code"], language="julia")
-
-                if st.button(f"▶️ تشغيل", key=f"run_{title}"):
-                    st.success("تم التشغيل!")
-
-            with col2:
-                st.markdown("**المخرجات:**")
-                st.markdown(f"<div class='output-block'><pre>{content['output']}</pre></div>", unsafe_allow_html=True)
-
-                st.markdown("**القواعد:**")
-                st.markdown(f"<div class='info-box'>{content['rules']}</div>", unsafe_allow_html=True)
-
-# Continue in next part due to length...
-# Sections 8-12 follow the same pattern
-
-# Section 8: Plotting
-elif menu == "📈 الرسوم البيانية":
-    st.markdown("## 📈 الرسوم البيانية في Julia")
-
-    st.markdown("""
-    <div class='info-box'>
-    <h3>مكتبات الرسم في Julia:</h3>
-    <ul style='font-size: 1.1rem; line-height: 1.8;'>
-    <li>📊 <strong>Plots.jl:</strong> المكتبة الأساسية للرسوم</li>
-    <li>📈 <strong>StatsPlots.jl:</strong> رسوم إحصائية</li>
-    <li>🎨 <strong>PlotlyJS.jl:</strong> رسوم تفاعلية</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Interactive Plotly examples
-    st.markdown("### 📊 أمثلة تفاعلية")
-
-    # Example 1: Line chart for time series
-    years = list(range(2015, 2025))
-    gdp = [450, 470, 495, 510, 525, 505, 520, 560, 595, 630]
-
-    fig1 = go.Figure()
-    fig1.add_trace(go.Scatter(
-        x=years,
-        y=gdp,
-        mode='lines+markers',
-        name='الناتج المحلي',
-        line=dict(color='#667eea', width=3),
-        marker=dict(size=10, color='#764ba2')
-    ))
-
-    fig1.update_layout(
-        title='تطور الناتج المحلي الإجمالي (2015-2024)',
-        xaxis_title='السنة',
-        yaxis_title='الناتج المحلي (مليار)',
-        template='plotly_white',
-        hovermode='x unified'
-    )
-
-    st.plotly_chart(fig1, use_container_width=True)
-
-    st.code("""
-# رسم خطي للسلاسل الزمنية
-using Plots
-
-سنوات = 2015:2024
-ناتج_محلي = [450, 470, 495, 510, 525, 505, 520, 560, 595, 630]
-
-plot(سنوات, ناتج_محلي, 
-    label="الناتج المحلي",
-    xlabel="السنة",
-    ylabel="الناتج المحلي (مليار)",
-    title="تطور الناتج المحلي الإجمالي",
-    lw=3,  # line width
-    marker=:circle,
-    markersize=8,
-    legend=:topleft,
-    color=:blue)
-    """, language="julia")
-
-    # Example 2: Bar chart
-    products = ['منتج A', 'منتج B', 'منتج C', 'منتج D', 'منتج E']
-    sales = [45000, 38000, 52000, 41000, 49000]
-
-    fig2 = go.Figure(data=[
-        go.Bar(
-            x=products,
-            y=sales,
-            marker=dict(
-                color=sales,
-                colorscale='Viridis',
-                showscale=True
-            ),
-            text=sales,
-            textposition='auto',
-        )
-    ])
-
-    fig2.update_layout(
-        title='مبيعات المنتجات',
-        xaxis_title='المنتج',
-        yaxis_title='المبيعات',
-        template='plotly_white'
-    )
-
-    st.plotly_chart(fig2, use_container_width=True)
-
-    st.code("""
-# رسم أعمدة للمبيعات
-using Plots
-
-منتجات = ["منتج A", "منتج B", "منتج C", "منتج D", "منتج E"]
-مبيعات = [45000, 38000, 52000, 41000, 49000]
-
-bar(منتجات, مبيعات,
-    title="مبيعات المنتجات",
-    xlabel="المنتج",
-    ylabel="المبيعات",
-    legend=false,
-    color=:viridis,
-    fillalpha=0.8)
-    """, language="julia")
-
-    # Example 3: Pie chart
-    categories = ['رواتب', 'إيجار', 'مواد خام', 'تسويق', 'أخرى']
-    values = [45, 20, 18, 12, 5]
-
-    fig3 = go.Figure(data=[go.Pie(
-        labels=categories,
-        values=values,
-        hole=.3,
-        marker=dict(colors=['#667eea', '#764ba2', '#fc466b', '#3f5efb', '#11998e'])
-    )])
-
-    fig3.update_layout(
-        title='توزيع النفقات',
-        template='plotly_white'
-    )
-
-    st.plotly_chart(fig3, use_container_width=True)
-
-    st.code("""
-# رسم دائري للنفقات
-using Plots
-
-فئات = ["رواتب", "إيجار", "مواد خام", "تسويق", "أخرى"]
-قيم = [45, 20, 18, 12, 5]
-
-pie(فئات, قيم,
-    title="توزيع النفقات",
-    legend=:outerbottom,
-    l=0.5)
-    """, language="julia")
-
-    # Example 4: Multiple lines
-    months = list(range(1, 13))
-    sales_2023 = [120, 135, 142, 128, 155, 148, 162, 139, 175, 182, 195, 210]
-    sales_2024 = [125, 140, 148, 135, 162, 155, 170, 148, 185, 192, 205, 220]
-
-    fig4 = go.Figure()
-    fig4.add_trace(go.Scatter(
-        x=months,
-        y=sales_2023,
-        mode='lines+markers',
-        name='2023',
-        line=dict(color='#667eea', width=2)
-    ))
-    fig4.add_trace(go.Scatter(
-        x=months,
-        y=sales_2024,
-        mode='lines+markers',
-        name='2024',
-        line=dict(color='#fc466b', width=2)
-    ))
-
-    fig4.update_layout(
-        title='مقارنة المبيعات الشهرية',
-        xaxis_title='الشهر',
-        yaxis_title='المبيعات (ألف)',
-        template='plotly_white',
-        hovermode='x unified'
-    )
-
-    st.plotly_chart(fig4, use_container_width=True)
-
-    st.code("""
-# رسم خطوط متعددة للمقارنة
-using Plots
-
-شهور = 1:12
-مبيعات_2023 = [120, 135, 142, 128, 155, 148, 162, 139, 175, 182, 195, 210]
-مبيعات_2024 = [125, 140, 148, 135, 162, 155, 170, 148, 185, 192, 205, 220]
-
-plot(شهور, مبيعات_2023, 
-    label="2023",
-    lw=2,
-    marker=:circle,
-    color=:blue)
-
-plot!(شهور, مبيعات_2024,
-    label="2024",
-    lw=2,
-    marker=:square,
-    color=:red,
-    xlabel="الشهر",
-    ylabel="المبيعات (ألف)",
-    title="مقارنة المبيعات الشهرية")
-    """, language="julia")
-
-    st.markdown("""
-    <div class='warning-box'>
-    <h3>⚠️ ملاحظات مهمة:</h3>
-    <ul style='font-size: 1.1rem;'>
-    <li>استخدم <code>plot()</code> لإنشاء رسم جديد</li>
-    <li>استخدم <code>plot!()</code> لإضافة على رسم موجود (لاحظ !)</li>
-    <li><code>savefig("name.png")</code> لحفظ الرسم</li>
-    <li>يمكن تخصيص الألوان والأحجام والأنماط</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-# Section 9: Functions
-elif menu == "🎲 الدوال":
-    st.markdown("## 🎲 الدوال (Functions)")
-
-    st.markdown("""
-    <div class='info-box'>
-    <h3>أهمية الدوال:</h3>
-    <p style='font-size: 1.1rem; line-height: 1.8;'>
-    الدوال تساعدك على تنظيم الكود وإعادة استخدامه. في Julia، الدوال سريعة جداً وسهلة التعريف.
-    </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    import streamlit as st
-
-    # Set page configuration for better layout and Arabic support
-    st.set_page_config(layout="wide", page_title="دليل Julia للاقتصاديين")
-
-    # --- Custom CSS for styling the blocks ---
-    # This CSS adds styling to the 'output-block' and 'info-box' divs used later.
-    st.markdown("""
-    <style>
-        /* Style for the code output block */
-        .output-block {
-            background-color: #f0f2f6; /* Light gray background */
-            border: 1px solid #dfe1e5;
-            border-radius: 8px;
-            padding: 1rem;
-            font-family: 'Consolas', 'Monaco', monospace;
-            color: #333;
-        }
-        .output-block pre {
-            white-space: pre-wrap; /* Ensures long lines wrap */
-            word-wrap: break-word;
-            margin: 0;
-        }
-        /* Style for the rules/info box */
-        .info-box {
-            background-color: #e8f0fe; /* Light blue background */
-            border: 1px solid #d2e3fc;
-            border-left: 5px solid #1a73e8; /* Blue left border */
-            border-radius: 8px;
-            padding: 1rem;
-            margin-top: 1rem;
-        }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # --- Page Title and Introduction ---
-    st.title("Interactive Julia Guide for Economists")
-    st.markdown("### دليل Julia التفاعلي للاقتصاديين: الدوال (Functions)")
-    st.markdown("---")
-
-    # --- Data for the examples ---
-    # This dictionary contains all the code examples, outputs, and rules.
-    examples = {
-        "تعريف الدوال الأساسية": {
-            "code": """# تعريف دالة بسيطة
-    function جمع(a, b)
-        return a + b
-    end
-
-    نتيجة = جمع(10, 20)
-    println("10 + 20 = ", نتيجة)
-
-    # دالة بدون return (آخر سطر هو المُرجع)
-    function ضرب(x, y)
-        x * y
-    end
-
-    println("5 × 6 = ", ضرب(5, 6))
-
-    # دالة مختصرة (للدوال البسيطة)
-    مربع(x) = x^2
-    println("مربع 7 = ", مربع(7))
-
-    # دالة مع قيمة افتراضية
-    function تحية(اسم="زائر")
-        println("مرحباً، ", اسم)
-    end
-
-    تحية("أحمد")
-    تحية()  # تستخدم القيمة الافتراضية""",
-            "output": """10 + 20 = 30
-    5 × 6 = 30
-    مربع 7 = 49
-    مرحباً، أحمد
-    مرحباً، زائر""",
-            "rules": """✅ **القواعد:**
-    <ul>
-        <li><code>function اسم(معاملات) ... end</code> لتعريف دالة.</li>
-        <li><code>return</code> لإرجاع قيمة بشكل صريح.</li>
-        <li>آخر سطر في الدالة يُرجع تلقائياً.</li>
-        <li>صيغة مختصرة: <code>اسم(x) = تعبير</code>.</li>
-        <li>قيم افتراضية: <code>معامل=قيمة</code>.</li>
-        <li>الاستدعاء: <code>اسم_الدالة(قيم)</code>.</li>
-    </ul>"""
-        },
-
-        "دوال اقتصادية": {
-            "code": """# دالة لحساب الفائدة البسيطة
-    function فائدة_بسيطة(رأس_مال, معدل, مدة)
-        فائدة = رأس_مال * معدل * مدة
-        مجموع = رأس_مال + فائدة
-        return فائدة, مجموع  # إرجاع أكثر من قيمة
-    end
-
-    ف, م = فائدة_بسيطة(10000, 0.05, 3)
-    println("الفائدة: ", ف)
-    println("المجموع: ", م)
-
-    # دالة لحساب الفائدة المركبة
-    function فائدة_مركبة(رأس_مال, معدل, مدة)
-        رأس_مال * (1 + معدل)^مدة
-    end
-
-    نتيجة = فائدة_مركبة(10000, 0.05, 3)
-    println("\\nبالفائدة المركبة: ", round(نتيجة, digits=2))
-
-    # دالة لحساب معدل النمو
-    function معدل_نمو(قيمة_بداية, قيمة_نهاية)
-        ((قيمة_نهاية - قيمة_بداية) / قيمة_بداية) * 100
-    end
-
-    نمو = معدل_نمو(1000, 1200)
-    println("معدل النمو: ", round(نمو, digits=2), "%")""",
-            "output": """الفائدة: 1500.0
-    المجموع: 11500.0
-
-    بالفائدة المركبة: 11576.25
-    معدل النمو: 20.0%""",
-            "rules": """✅ **القواعد:**
-    <ul>
-        <li>يمكن إرجاع عدة قيم: <code>return x, y, z</code>.</li>
-        <li>استقبال القيم المتعددة: <code>a, b, c = دالة()</code>.</li>
-        <li>الأسماء العربية للدوال والمعاملات مسموحة.</li>
-        <li>استخدم الدوال لتجنب تكرار الكود.</li>
-        <li>الدوال تجعل الكود أكثر تنظيماً وقابلية للقراءة.</li>
-    </ul>"""
-        },
-
-        "دوال مع معاملات اختيارية": {
-            "code": """# دالة مع معاملات اختيارية (Keyword Arguments)
-    function تقرير_مالي(إيرادات, نفقات;
-                          معدل_ضريبة=0.15,
-                          اسم_الشركة="غير محدد")
-
-        ربح = إيرادات - نفقات
-        ضريبة = ربح * معدل_ضريبة
-        صافي_ربح = ربح - ضريبة
-
-        println("=" ^ 40)
-        println("تقرير مالي: ", اسم_الشركة)
-        println("-" ^ 40)
-        println("الإيرادات: ", إيرادات)
-        println("النفقات: ", نفقات)
-        println("الربح قبل الضريبة: ", ربح)
-        println("الضريبة (", معدل_ضريبة * 100, "%): ", ضريبة)
-        println("صافي الربح: ", صافي_ربح)
-        println("=" ^ 40)
-
-        return صافي_ربح
-    end
-
-    # استخدام بدون معاملات اختيارية (يستخدم القيم الافتراضية)
-    تقرير_مالي(100000, 70000)
-
-    println("\\n")
-
-    # استخدام مع تحديد معاملات اختيارية
-    تقرير_مالي(100000, 70000,
-                معدل_ضريبة=0.20,
-                اسم_الشركة="شركة النجاح")""",
-            "output": """========================================
-    تقرير مالي: غير محدد
-    ----------------------------------------
-    الإيرادات: 100000
-    النفقات: 70000
-    الربح قبل الضريبة: 30000
-    الضريبة (15.0%): 4500.0
-    صافي الربح: 25500.0
-    ========================================
-
-
-    ========================================
-    تقرير مالي: شركة النجاح
-    ----------------------------------------
-    الإيرادات: 100000
-    النفقات: 70000
-    الربح قبل الضريبة: 30000
-    الضريبة (20.0%): 6000.0
-    صافي الربح: 24000.0
-    ========================================
-    """,
-            "rules": """✅ **القواعد:**
-    <ul>
-        <li>الفاصلة المنقوطة <code>;</code> تفصل بين المعاملات العادية والاختيارية.</li>
-        <li>تُعرّف المعاملات الاختيارية: <code>اسم=قيمة_افتراضية</code>.</li>
-        <li>عند الاستدعاء، تُمرر بالاسم: <code>اسم_معامل=قيمة</code>.</li>
-        <li>لا يهم ترتيب المعاملات الاختيارية عند الاستدعاء.</li>
-        <li>يمكن تحديد بعضها وترك البعض الآخر ليأخذ القيمة الافتراضية.</li>
-    </ul>"""
-        },
-
-        "دوال متقدمة": {
-            "code": """# دالة تقبل مصفوفة كمدخل
-    function احصاءات(بيانات)
-        using Statistics # استدعاء مكتبة الإحصاء
-
-        نتائج = Dict(
-            "المتوسط" => mean(بيانات),
-            "الوسيط" => median(بيانات),
-            "الحد_الأقصى" => maximum(بيانات),
-            "الحد_الأدنى" => minimum(بيانات),
-            "الانحراف_المعياري" => std(بيانات)
-        )
-        return نتائج
-    end
-
-    مبيعات = [120, 135, 142, 128, 155, 148, 162]
-    نتائج = احصاءات(مبيعات)
-    println("الإحصاءات:")
-    for (مفتاح, قيمة) in نتائج
-        println(مفتاح, ": ", round(قيمة, digits=2))
-    end
-
-    # دالة تقبل دالة أخرى كمعامل (Higher-order function)
-    function طبق_خصم(أسعار, دالة_خصم)
-        return map(دالة_خصم, أسعار)
-    end
-
-    أسعار = [100, 200, 150, 300]
-    # تعريف دالة خصم 10% (دالة مجهولة)
-    خصم_10 = x -> x * 0.9
-    أسعار_بعد_خصم = طبق_خصم(أسعار, خصم_10)
-
-    println("\\nالأسعار الأصلية: ", أسعار)
-    println("بعد خصم 10%: ", أسعار_بعد_خصم)
-
-    # خصم 20% على أسعار فوق 150
-    خصم_خاص = x -> x > 150 ? x * 0.8 : x
-    أسعار_خصم_خاص = طبق_خصم(أسعار, خصم_خاص)
-    println("خصم خاص: ", أسعار_خصم_خاص)""",
-            "output": """الإحصاءات:
-    المتوسط: 141.43
-    الوسيط: 142.0
-    الحد_الأقصى: 162
-    الحد_الأدنى: 120
-    الانحراف_المعياري: 14.58
-
-    الأسعار الأصلية: [100, 200, 150, 300]
-    بعد خصم 10%: [90.0, 180.0, 135.0, 270.0]
-    خصم خاص: [100, 160.0, 150, 240.0]""",
-            "rules": """✅ **القواعد:**
-    <ul>
-        <li>الدوال يمكنها إرجاع هياكل بيانات معقدة مثل <code>Dict</code>.</li>
-        <li><b>الدوال العليا (Higher-order):</b> هي دوال تقبل دوال أخرى كمعاملات.</li>
-        <li><code>-></code> تُستخدم لتعريف دوال مجهولة (anonymous functions).</li>
-        <li><code>map(f, array)</code> تُستخدم لتطبيق دالة <code>f</code> على كل عنصر في مصفوفة.</li>
-        <li>استخدام الدوال العليا يجعل الكود أكثر مرونة وقابلية لإعادة الاستخدام.</li>
-    </ul>"""
-        },
-
-        "التوثيق والمساعدة": {
-            "code": """# توثيق الدالة باستخدام docstring
-    \"\"\"
-        حساب_roi(استثمار, عائد)
-
-        حساب معدل العائد على الاستثمار (ROI).
-
-        # معاملات
-        - `استثمار`: المبلغ المستثمر.
-        - `عائد`: العائد المحقق من الاستثمار.
-
-        # إرجاع
-        - معدل العائد كنسبة مئوية.
-
-        # مثال
-        ```julia
-        roi = حساب_roi(10000, 12000)
-        println("العائد: ", roi, "%")
-        ```
-    \"\"\"
-    function حساب_roi(استثمار, عائد)
-        ((عائد - استثمار) / استثمار) * 100
-    end
-
-    # استخدام الدالة
-    roi = حساب_roi(50000, 65000)
-    println("معدل العائد على الاستثمار: ", round(roi, digits=2), "%")
-
-    # دالة مع تحديد نوع البيانات (Type Assertion)
-    function قسمة_آمنة(a::Number, b::Number)
-        if b == 0
-            println("خطأ: لا يمكن القسمة على صفر")
-            return nothing # إرجاع قيمة فارغة
-        end
-        return a / b
-    end
-
-    نتيجة = قسمة_آمنة(10, 2)
-    println("\\n10 ÷ 2 = ", نتيجة)
-    println("محاولة القسمة على صفر:")
-    نتيجة_خطأ = قسمة_آمنة(10, 0)
-    """,
-            "output": """معدل العائد على الاستثمار: 30.0%
-
-    10 ÷ 2 = 5.0
-    محاولة القسمة على صفر:
-    خطأ: لا يمكن القسمة على صفر""",
-            "rules": """✅ **القواعد:**
-    <ul>
-        <li><code>\"\"\"...\"\"\"</code> قبل تعريف الدالة لإنشاء توثيق (docstring).</li>
-        <li><code>::Type</code> لتحديد نوع البيانات المتوقع للمعامل.</li>
-        <li><code>nothing</code> هي القيمة المستخدمة لتمثيل "لا شيء" أو القيمة الفارغة.</li>
-        <li>التوثيق الجيد ضروري للمشاريع الكبيرة ولتسهيل التعاون.</li>
-        <li>في Julia REPL، اكتب <code>?اسم_الدالة</code> لعرض التوثيق.</li>
-    </ul>"""
-        }
-    }
-
-    # --- Main Application Logic ---
-    # This loop iterates over the dictionary and creates an expander for each item.
-    for title, content in examples.items():
-        with st.expander(f"**{title}**", expanded=False):
-            col1, col2 = st.columns([1.1, 0.9])  # Give code column slightly more space
-
-            with col1:
-                st.markdown("**الكود:**")
-                st.code(content["code"], language="julia")
-
-                # This button is for demonstration; it doesn't execute the Julia code.
-                if st.button(f"▶️ تشغيل (محاكاة)", key=f"run_{title}"):
-                    st.toast(f"تم عرض مخرجات '{title}'", icon="🎉")
-
-            with col2:
-                st.markdown("**المخرجات المتوقعة:**")
-                st.markdown(f"<div class='output-block'><pre>{content['output']}</pre></div>", unsafe_allow_html=True)
-
-                st.markdown(f"<div class='info-box'>{content['rules']}</div>", unsafe_allow_html=True)
-
-    # --- Footer Section ---
-    # This is the corrected footer with proper HTML.
-    st.markdown("---")
-    st.markdown("""
-    <div style='text-align: center; padding: 2rem; background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%); border-radius: 15px;'>
-        <h2 style='color: #667eea;'>🎓 د.مروان رودان</h2>
-        <p style='font-size: 1.2rem; color: #4a5568;'>
-            دليل Julia الشامل للاقتصاديين العرب
-        </p>
-        <p style='color: #718096;'>
-            تم التصميم بعناية للطلاب والباحثين في الاقتصاد
-        </p>
-        <p style='margin-top: 1rem; color: #667eea; font-weight: bold;'>
-            📧 للاستفسارات والدعم الفني
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+# Arabic by default; the sidebar switches to English in place.
+app.main("ar")
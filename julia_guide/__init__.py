@@ -0,0 +1 @@
+"""Shared building blocks for the Julia guide apps (julia.py and julia2.py)."""
@@ -0,0 +1,75 @@
+"""The bilingual Streamlit app behind julia.py and julia2.py.
+
+Both scripts run the same page and only differ in the locale a new
+session starts in. The sidebar switches language in place: the selected
+section, the inputs and the opened cards carry over, and both locales
+share one process with the same catalog, highlight and figure caches.
+The current language is kept in ``?lang=`` so links open in it.
+"""
+
+import streamlit as st
+
+from julia_guide import catalog, highlight, sections, theme
+
+
+def current_locale(default):
+    if "locale" not in st.session_state:
+        linked = st.query_params.get("lang")
+        st.session_state["locale"] = linked if linked in catalog.LOCALES else default
+    return st.session_state["locale"]
+
+
+def follow_locale():
+    st.query_params["lang"] = st.session_state["locale"]
+
+
+def main(default_locale):
+    loc = current_locale(default_locale)
+
+    # Page configuration
+    st.set_page_config(
+        page_title=theme.PAGE_TITLE[loc],
+        page_icon="📊",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # Custom CSS for beautiful design, header/footer and highlighted code
+    st.markdown(theme.style_tag(loc, highlight.CSS), unsafe_allow_html=True)
+
+    # Header
+    st.markdown(theme.HEADER[loc], unsafe_allow_html=True)
+
+    # Sidebar navigation
+    st.sidebar.radio(
+        theme.LANGUAGE_LABEL[loc],
+        catalog.LOCALES,
+        format_func=theme.LANGUAGES.get,
+        key="locale",
+        horizontal=True,
+        on_change=follow_locale
+    )
+    st.sidebar.markdown(theme.MENU_TITLE[loc])
+    st.sidebar.markdown("---")
+
+    # Pick up edited examples without restarting the server
+    catalog.refresh(loc)
+
+    # Deep links: ?section=<id>&example=<title>
+    linked_section, linked_example = sections.linked(loc)
+    if linked_section and "menu" not in st.session_state:
+        st.session_state["menu"] = linked_section
+
+    menu = st.sidebar.radio(
+        theme.MENU_LABEL[loc],
+        list(sections.MENU[loc]),
+        format_func=sections.MENU[loc].get,
+        key="menu",
+        on_change=sections.follow_menu
+    )
+
+    sections.render(loc, menu, linked_example if menu == linked_section else None)
+
+    # Footer for all pages
+    st.markdown("---")
+    st.markdown(theme.FOOTER[loc], unsafe_allow_html=True)
@@ -0,0 +1,125 @@
+"""Performance budgets that can be checked before a deploy.
+
+Run ``python -m julia_guide.budgets`` from the repository root; it exits
+with a non-zero status when a budget is exceeded. ``--report SECTION``
+prints what each element of a section sends to the browser instead.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries that only the chart pages may pull in, beyond what Streamlit
+# itself already imports.
+HEAVY_MODULES = ("plotly", "pandas", "numpy")
+
+# Seconds allowed for importing the guide and the landing section, on top
+# of Streamlit itself.
+STARTUP_BUDGET = 0.5
+
+# Bytes a section may send on a full rerun, summed over its elements.
+DELTA_BUDGET = 32 * 1024
+DELTA_BUDGETS = {"plotting": 80 * 1024}
+
+SCRIPTS = {"ar": "julia.py", "en": "julia2.py"}
+
+# Streamlit may import plotly itself, so only modules added after
+# ``import streamlit`` count against the guide.
+_STARTUP_PROBE = """
+import sys, time
+import streamlit
+before = set(sys.modules)
+start = time.perf_counter()
+from julia_guide import sections
+sections.load({section!r})
+print(time.perf_counter() - start)
+print(" ".join(sorted(name for name in set(sys.modules) - before if name.split(".")[0] in {heavy!r})))
+"""
+
+
+def check_startup(section="basics", budget=STARTUP_BUDGET):
+    """Import ``section`` in a fresh interpreter and return a list of problems."""
+    probe = _STARTUP_PROBE.format(section=section, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    elapsed, _, heavy = result.stdout.strip().partition("\n")
+    problems = []
+    if float(elapsed) > budget:
+        problems.append(f"{section}: startup took {float(elapsed):.3f}s (budget {budget:.3f}s)")
+    if heavy:
+        problems.append(f"{section}: imported heavy modules: {heavy}")
+    return problems
+
+
+def measure_deltas(locale, section):
+    """Run the app headlessly on ``section``; return ``[(element, bytes)]``.
+
+    The sizes are those of the element messages, without the websocket
+    framing, which is the same for every element.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(os.path.join(ROOT, SCRIPTS[locale]), default_timeout=30)
+    app.session_state["menu"] = section
+    app.run()
+    if app.exception:
+        raise RuntimeError(f"{locale}/{section}: {app.exception[0].message}")
+
+    sizes = []
+
+    def walk(node, path):
+        children = getattr(node, "children", None)
+        if children is None:
+            sizes.append((path, node.proto.ByteSize()))
+            return
+        for index, child in children.items():
+            walk(child, f"{path}/{index}:{child.type}")
+
+    walk(app.sidebar, "sidebar")
+    walk(app.main, "main")
+    return sizes
+
+
+def check_deltas(budget=DELTA_BUDGET, budgets=DELTA_BUDGETS):
+    """Render every section of both locales and return a list of problems."""
+    from julia_guide import catalog
+
+    problems = []
+    for locale in catalog.LOCALES:
+        for section in catalog.SECTIONS:
+            total = sum(size for _, size in measure_deltas(locale, section))
+            limit = budgets.get(section, budget)
+            if total > limit:
+                problems.append(f"{locale}/{section}: sends {total} bytes (budget {limit})")
+    return problems
+
+
+def report(locale, section):
+    sizes = measure_deltas(locale, section)
+    for path, size in sorted(sizes, key=lambda item: -item[1]):
+        print(f"{size:8d}  {path}")
+    print(f"{sum(size for _, size in sizes):8d}  total")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the performance budgets.")
+    parser.add_argument("--report", metavar="SECTION", help="print the bytes each element of SECTION sends")
+    parser.add_argument("--locale", default="en", choices=sorted(SCRIPTS))
+    args = parser.parse_args(argv)
+
+    if args.report:
+        report(args.locale, args.report)
+        return 0
+
+    problems = check_startup() + check_deltas()
+    for problem in problems:
+        print(problem)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
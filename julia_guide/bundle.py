@@ -0,0 +1,107 @@
+"""Build step that validates the example content and compiles it to a bundle.
+
+Run ``python -m julia_guide.bundle`` before a deploy. It checks every
+locale against the schema below and, if nothing is wrong, writes
+``julia_guide/content/examples.bundle``, which the catalog memory-maps
+instead of importing the content modules. It exits with a non-zero
+status and writes nothing when a check fails.
+"""
+
+import ast
+import importlib
+import marshal
+import os
+import sys
+
+from julia_guide import catalog
+
+FIELDS = ("code", "output", "rules")
+
+
+def duplicate_keys(locale):
+    """Return problems for keys repeated in the EXAMPLES literal.
+
+    A repeated key silently replaces the earlier entry once the module is
+    imported, so this reads the source instead. Titles must also be unique
+    per section because they name the ``run_{title}`` widget keys.
+    """
+    path = os.path.join(catalog.CONTENT_DIR, f"{locale}.py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+
+    problems = []
+
+    def check(node, where):
+        seen = set()
+        for key in node.keys:
+            if isinstance(key, ast.Constant):
+                if key.value in seen:
+                    problems.append(f"{locale}: {where}: duplicate key {key.value!r} (line {key.lineno})")
+                seen.add(key.value)
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "EXAMPLES" for target in node.targets
+        ) and isinstance(node.value, ast.Dict):
+            check(node.value, "EXAMPLES")
+            for key, value in zip(node.value.keys, node.value.values):
+                if isinstance(key, ast.Constant) and isinstance(value, ast.Dict):
+                    check(value, key.value)
+    return problems
+
+
+def validate(locale, examples):
+    """Return the schema problems of one locale's examples."""
+    problems = []
+    for section, entries in examples.items():
+        if section not in catalog.SECTIONS:
+            problems.append(f"{locale}: unknown section {section!r}")
+        for title, content in entries.items():
+            if not isinstance(title, str) or not title.strip():
+                problems.append(f"{locale}: {section}: empty or non-string title {title!r}")
+            if not isinstance(content, dict):
+                problems.append(f"{locale}: {section}: {title!r} is not a dict")
+                continue
+            for field in FIELDS:
+                if not isinstance(content.get(field), str) or not content[field].strip():
+                    problems.append(f"{locale}: {section}: {title!r} has no {field!r}")
+            for field in content.keys() - set(FIELDS):
+                problems.append(f"{locale}: {section}: {title!r} has unknown field {field!r}")
+    return problems
+
+
+def build(path=catalog.BUNDLE):
+    """Validate every locale and write the bundle; return the problems found."""
+    problems = []
+    examples = {}
+    for locale in catalog.LOCALES:
+        module = importlib.import_module(f"julia_guide.content.{locale}")
+        problems += duplicate_keys(locale)
+        problems += validate(locale, module.EXAMPLES)
+        examples[locale] = module.EXAMPLES
+    if problems:
+        return problems
+
+    bundle = {
+        "sources": {locale: catalog.source_digest(locale) for locale in catalog.LOCALES},
+        "examples": examples,
+    }
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(catalog.BUNDLE_MAGIC)
+        marshal.dump(bundle, f)
+    os.replace(tmp, path)
+    return []
+
+
+def main():
+    problems = build()
+    for problem in problems:
+        print(problem)
+    if not problems:
+        print(f"Wrote {os.path.relpath(catalog.BUNDLE)}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""Example cards: the code / output / rules expanders shared by every section."""
+
+import html
+import re
+from functools import lru_cache
+
+import streamlit as st
+
+from julia_guide import catalog, highlight, results, workers
+
+LABELS = {
+    "ar": {
+        "code": "**الكود:**",
+        "run": "▶️ تشغيل",
+        "ran": "تم التشغيل!",
+        "output": "**المخرجات:**",
+        "rules": "**القواعد:**",
+        "run_simulated": "▶️ تشغيل (محاكاة)",
+        "shown": "تم عرض مخرجات '{title}'",
+        "expected_output": "**المخرجات المتوقعة:**",
+    },
+    "en": {
+        "code": "**Code:**",
+        "run": "▶️ Run",
+        "ran": "Execution simulated!",
+        "output": "**Output:**",
+        "rules": "**Rules:**",
+        "run_simulated": "▶️ Run (Simulated)",
+        "shown": "Output for '{title}' displayed!",
+        "expected_output": "**Expected Output:**",
+    },
+}
+
+# Room for every box of both locales, with slack for live edits; older
+# versions of edited texts fall out instead of piling up.
+BOX_CACHE_SIZE = 256
+
+_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+
+
+@lru_cache(maxsize=BOX_CACHE_SIZE)
+def output_html(output):
+    """Return the escaped output block for ``output``, built once per distinct text."""
+    return f"<div class='output-block'><pre>{html.escape(output, quote=False)}</pre></div>"
+
+
+@lru_cache(maxsize=BOX_CACHE_SIZE)
+def info_html(rules):
+    """Return the info box for ``rules``, built once per distinct text."""
+    return f"<div class='info-box'>{rules_body(rules)}</div>"
+
+
+def rules_body(rules):
+    """Return ``rules`` ready to embed in HTML.
+
+    The Functions rules are written as HTML lists and are kept as they
+    are; every other rules text is plain and gets escaped, even where it
+    mentions operators such as ``<``.
+    """
+    return rules if _TAG.search(rules) else html.escape(rules, quote=False)
+
+
+def run_button(label, message, key, code, toast=False):
+    if not st.button(label, key=key):
+        return
+    try:
+        result = results.run(code)
+    except workers.JuliaUnavailable:
+        # No Julia on this server: keep the simulated behaviour.
+        if toast:
+            st.toast(message, icon="🎉")
+        else:
+            st.success(message)
+        return
+    if result.ok:
+        st.html(output_html(result.output))
+    else:
+        st.error(result.output)
+
+
+def is_open(card_key, default=False):
+    return st.session_state.setdefault("open_cards", {}).get(card_key, default)
+
+
+def _remember(card_key, widget_key):
+    st.session_state.setdefault("open_cards", {})[card_key] = st.session_state[widget_key]
+
+
+def card_toggle(card_key, label, default=False):
+    """Draw the open/closed switch of a card and return whether it is open.
+
+    The state is kept in ``st.session_state["open_cards"]`` rather than in
+    the widget key alone, so it survives switching to another section and
+    back. Cards are keyed by section and position, which both locales
+    share, so an open card stays open across a language switch.
+    """
+    widget_key = f"open_{card_key}"
+    return st.toggle(
+        label,
+        value=is_open(card_key, default),
+        key=widget_key,
+        on_change=_remember,
+        args=(card_key, widget_key),
+    )
+
+
+@st.fragment
+def example_card(locale, section, index, title, content, expanded=False):
+    # A card is its own fragment: opening it or pressing Run reruns only
+    # this card. Its body is only built and sent while the card is open.
+    labels = LABELS[locale]
+
+    with st.container(border=True):
+        if not card_toggle(f"{section}:{index}", f"**{title}**", expanded):
+            return
+
+        col1, col2 = st.columns([1, 1])
+
+        with col1:
+            st.markdown(labels["code"])
+            highlight.code(content["code"])
+
+            run_button(labels["run"], labels["ran"], key=f"run_{title}", code=content["code"])
+
+        with col2:
+            st.markdown(labels["output"])
+            # st.html: blank lines in the output would end a markdown HTML block.
+            st.html(output_html(content["output"]))
+
+            st.markdown(labels["rules"])
+            st.markdown(info_html(content["rules"]), unsafe_allow_html=True)
+
+
+@st.fragment
+def simulated_example_card(locale, section, index, title, content, expanded=False):
+    # Variant used by the Functions page: wider code column, a toast on Run
+    # and rules that carry their own HTML heading.
+    labels = LABELS[locale]
+
+    with st.container(border=True):
+        if not card_toggle(f"{section}:{index}", f"**{title}**", expanded):
+            return
+
+        col1, col2 = st.columns([1.1, 0.9])
+
+        with col1:
+            st.markdown(labels["code"])
+            highlight.code(content["code"])
+
+            run_button(
+                labels["run_simulated"],
+                labels["shown"].format(title=title),
+                key=f"run_{title}",
+                code=content["code"],
+                toast=True,
+            )
+
+        with col2:
+            st.markdown(labels["expected_output"])
+            st.html(output_html(content["output"]))
+
+            st.markdown(info_html(content["rules"]), unsafe_allow_html=True)
+
+
+def render_examples(locale, section, expanded=False):
+    for index, (title, content) in enumerate(catalog.examples(locale, section).items()):
+        example_card(locale, section, index, title, content, expanded)
+
+
+def render_simulated_examples(locale, section):
+    for index, (title, content) in enumerate(catalog.examples(locale, section).items()):
+        simulated_example_card(locale, section, index, title, content)
+
+
+def render_example(locale, section, title):
+    # A single card, opened, for deep links to one example.
+    examples = catalog.examples(locale, section)
+    index = list(examples).index(title)
+    if section == "functions":
+        simulated_example_card(locale, section, index, title, examples[title], expanded=True)
+    else:
+        example_card(locale, section, index, title, examples[title], expanded=True)
@@ -0,0 +1,147 @@
+"""Process-wide, read-only content catalog.
+
+The example literals live in ``julia_guide.content.<locale>``. They are
+imported and frozen once per server process, so a Streamlit rerun only
+does dictionary lookups and every session shares the same objects.
+
+When ``python -m julia_guide.bundle`` has compiled an up-to-date bundle,
+the examples are read from it instead of importing the content modules.
+
+``refresh()`` picks up edits to a content module while the server runs.
+It reloads only that locale and tells the ``on_change`` listeners which
+examples changed, so caches drop those entries and keep the rest. A
+module that fails to import is reported and the previous content stays.
+"""
+
+import hashlib
+import importlib
+import marshal
+import mmap
+import os
+import threading
+import traceback
+from functools import lru_cache
+from types import MappingProxyType
+
+LOCALES = ("ar", "en")
+
+SECTIONS = (
+    "introduction",
+    "basics",
+    "data_types",
+    "arithmetic",
+    "loops",
+    "conditionals",
+    "arrays",
+    "plotting",
+    "functions",
+    "packages",
+    "errors",
+    "applications",
+)
+
+_EMPTY = MappingProxyType({})
+
+_LOCK = threading.Lock()
+_LISTENERS = []
+_STAMPS = {}
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+BUNDLE = os.path.join(CONTENT_DIR, "examples.bundle")
+
+# The marshal format changes between Python versions, so it is part of the header.
+BUNDLE_MAGIC = b"JGB1" + bytes([marshal.version])
+
+
+def source_digest(locale):
+    with open(os.path.join(CONTENT_DIR, f"{locale}.py"), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _read_bundle(path=BUNDLE):
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+                return None
+            view = memoryview(data)[len(BUNDLE_MAGIC):]
+            try:
+                return marshal.loads(view)
+            finally:
+                view.release()
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+@lru_cache(maxsize=None)
+def load(locale):
+    """Return the frozen ``section -> title -> {code, output, rules}`` mapping."""
+    if locale not in LOCALES:
+        raise KeyError(f"Unknown locale: {locale!r}")
+    bundle = _read_bundle()
+    if bundle and bundle["sources"].get(locale) == source_digest(locale):
+        return _freeze(bundle["examples"][locale])
+    module = importlib.import_module(f"julia_guide.content.{locale}")
+    return _freeze(module.EXAMPLES)
+
+
+def examples(locale, section):
+    """Return the examples of one section, in display order."""
+    return load(locale).get(section, _EMPTY)
+
+
+def on_change(listener):
+    """Call ``listener(locale, changes)`` after ``refresh`` reloads a locale.
+
+    ``changes`` maps ``(section, title)`` to ``(old, new)``; ``old`` is None
+    for an added example and ``new`` is None for a removed one.
+    """
+    _LISTENERS.append(listener)
+    return listener
+
+
+def _stamp(locale):
+    return os.stat(os.path.join(CONTENT_DIR, f"{locale}.py")).st_mtime_ns
+
+
+def _diff(old, new):
+    changes = {}
+    for section in old.keys() | new.keys():
+        before, after = old.get(section, _EMPTY), new.get(section, _EMPTY)
+        for title in before.keys() | after.keys():
+            if before.get(title) != after.get(title):
+                changes[section, title] = (before.get(title), after.get(title))
+    return changes
+
+
+def refresh(locale):
+    """Reload ``locale`` if its content module changed on disk; return the changes."""
+    stamp = _stamp(locale)
+    if _STAMPS.setdefault(locale, stamp) == stamp:
+        return {}
+    with _LOCK:
+        if _STAMPS[locale] == stamp:
+            return {}
+        # Recorded up front, so a broken save is reported once, not on every rerun.
+        _STAMPS[locale] = stamp
+        old = load(locale)
+        module = importlib.import_module(f"julia_guide.content.{locale}")
+        try:
+            importlib.reload(module)
+            new = _freeze(module.EXAMPLES)
+        except Exception:
+            # Saved halfway through an edit: keep serving the content
+            # already loaded until the file is saved again.
+            traceback.print_exc()
+            return {}
+        load.cache_clear()
+        changes = _diff(old, new)
+    for listener in _LISTENERS:
+        listener(locale, changes)
+    return changes
@@ -0,0 +1 @@
+"""Example content for the guide, one module per locale."""
@@ -0,0 +1,143 @@
+"""Check the stored ``output`` of every example against a real run.
+
+    python -m julia_guide.drift            # once, one Julia worker per CPU
+    python -m julia_guide.drift --watch    # again on every content change
+
+Outputs are compared loosely: whitespace is collapsed and numbers match
+when they agree to the precision the less precise of the two is written
+in, so a stored ``21589.25`` accepts ``21589.249999999996``. Mismatches
+are reported per locale and section and make the command exit non-zero.
+``--watch`` keeps the workers warm and re-runs only the examples that
+changed.
+
+The stored outputs of the two locales are also compared with each other,
+example by example in section order: their numbers should agree even
+though the text is translated. Those differences are reported but do not
+fail the check, since some outputs legitimately depend on the language.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+from julia_guide import catalog, regenerate, workers
+
+NUMBER = re.compile(r"([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)")
+
+# Relative slack for numbers written to the same precision.
+REL_TOL = 1e-9
+
+
+def _precision(number):
+    mantissa, _, exponent = number.lower().partition("e")
+    decimals = len(mantissa.partition(".")[2])
+    return 0.5 * 10.0 ** (int(exponent or 0) - decimals)
+
+
+def same_number(expected, actual):
+    a, b = float(expected), float(actual)
+    tolerance = max(_precision(expected), _precision(actual), REL_TOL * max(abs(a), abs(b)))
+    return abs(a - b) <= tolerance
+
+
+def same_output(expected, actual):
+    """True if ``actual`` matches ``expected`` up to whitespace and number precision."""
+    expected_parts = NUMBER.split(expected)
+    actual_parts = NUMBER.split(actual)
+    if len(expected_parts) != len(actual_parts):
+        return False
+    for index, (left, right) in enumerate(zip(expected_parts, actual_parts)):
+        if index % 2:
+            if not same_number(left, right):
+                return False
+        elif left.split() != right.split():
+            return False
+    return True
+
+
+def check(pool, keys=None):
+    """Run the examples named by ``keys`` (default: all); return the mismatches.
+
+    Each mismatch is ``(locale, section, title, detail)``.
+    """
+    examples = regenerate.all_examples()
+    if keys is not None:
+        examples = {key: code for key, code in examples.items() if key in keys}
+    mismatches = []
+    for (locale, section, title), result in regenerate.run_examples(pool, examples).items():
+        stored = catalog.examples(locale, section)[title]["output"]
+        if not result.ok:
+            mismatches.append((locale, section, title, f"failed: {result.output.strip()}"))
+        elif not same_output(stored, result.output):
+            mismatches.append((locale, section, title, f"expected:\n{stored}\nactual:\n{result.output.rstrip()}"))
+    return mismatches
+
+
+def locale_differences():
+    """Return ``(section, ar title, en title)`` for paired examples whose numbers differ."""
+    differences = []
+    for section in catalog.SECTIONS:
+        pairs = zip(*(catalog.examples(locale, section).items() for locale in catalog.LOCALES))
+        for (first_title, first), (second_title, second) in pairs:
+            first_numbers = NUMBER.findall(first["output"])
+            second_numbers = NUMBER.findall(second["output"])
+            if len(first_numbers) != len(second_numbers) or not all(
+                same_number(a, b) for a, b in zip(first_numbers, second_numbers)
+            ):
+                differences.append((section, first_title, second_title))
+    return differences
+
+
+def report(mismatches):
+    for locale in catalog.LOCALES:
+        for section in catalog.SECTIONS:
+            found = [(title, detail) for loc, sec, title, detail in mismatches if (loc, sec) == (locale, section)]
+            if found:
+                print(f"== {locale}/{section}: {len(found)} mismatched")
+                for title, detail in found:
+                    print(f"-- {title}\n{detail}\n")
+    for section, first_title, second_title in locale_differences():
+        print(f"~~ {section}: {' / '.join(catalog.LOCALES)} outputs differ: {first_title!r} / {second_title!r}")
+    print(f"{len(mismatches)} mismatched outputs")
+
+
+def watch(pool, interval=1.0):
+    # catalog.refresh reloads an edited content module and names the
+    # examples that changed; only those are run again.
+    for locale in catalog.LOCALES:
+        catalog.refresh(locale)
+    while True:
+        time.sleep(interval)
+        changed = set()
+        for locale in catalog.LOCALES:
+            changed |= {
+                (locale, section, title)
+                for (section, title), (_, new) in catalog.refresh(locale).items()
+                if new is not None
+            }
+        if changed:
+            report(check(pool, changed))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the stored outputs with real runs.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="Julia workers (default: one per CPU)")
+    parser.add_argument("--preload", default=",".join(regenerate.PRELOAD), help="packages each worker loads once")
+    parser.add_argument("--julia", default=os.environ.get("JULIA_BIN", "julia"), help="Julia executable")
+    parser.add_argument("--watch", action="store_true", help="keep running and re-check edited examples")
+    args = parser.parse_args(argv)
+
+    pool = workers.JuliaPool(
+        size=args.jobs, timeout=120, julia=args.julia, preload=tuple(filter(None, args.preload.split(",")))
+    )
+    mismatches = check(pool)
+    report(mismatches)
+    if args.watch:
+        watch(pool)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
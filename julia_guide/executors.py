@@ -0,0 +1,233 @@
+"""Backends that run the examples behind the Run buttons.
+
+An executor queues submitted snippets on a fixed number of threads and
+reports, for each one, its output, how long it waited and how long it
+ran. Output can be followed as it arrives and queued or running jobs can
+be cancelled. Two backends are provided:
+
+``JuliaExecutor``   runs the code on the warm worker pool in ``workers``
+``ReplayExecutor``  replays the catalog's ``output`` strings after a set
+                    delay, deterministically and without Julia
+
+``JULIA_EXECUTOR=replay`` switches the app to the replay backend, with
+``JULIA_REPLAY_LATENCY`` seconds per run (default 0.2). The replay
+backend also drives the load test::
+
+    python -m julia_guide.executors --backend replay --clients 50 --runs 1000
+"""
+
+import abc
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+
+from julia_guide import catalog, workers
+
+Execution = namedtuple("Execution", "ok output queued elapsed")
+
+
+class SnippetError(Exception):
+    """The snippet ran and failed; the message is what it printed."""
+
+
+class Job:
+    """A submitted snippet: wait for its Execution, or cancel it."""
+
+    def __init__(self, code, on_output=None):
+        self.code = code
+        self.on_output = on_output
+        self.submitted = time.perf_counter()
+        self.cancelled = threading.Event()
+        self.future = Future()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def cancel(self):
+        # A queued job never starts; a running one is stopped by its backend.
+        self.cancelled.set()
+        self.future.cancel()
+
+
+class Executor(abc.ABC):
+    """Base class: queues jobs and times them. Backends implement ``execute``."""
+
+    def __init__(self, concurrency=2):
+        self.concurrency = concurrency
+        self._threads = ThreadPoolExecutor(concurrency, thread_name_prefix=type(self).__name__)
+
+    def start(self):
+        """Get ready to run; called by the startup warmup."""
+
+    @property
+    def runtime(self):
+        """What the output depends on besides the code, for result caching."""
+        return type(self).__name__
+
+    @abc.abstractmethod
+    def execute(self, code, cancelled):
+        """Yield the output of ``code`` in chunks; raise SnippetError if it fails.
+
+        ``cancelled`` is a threading.Event; once it is set the backend
+        should stop the snippet and return promptly.
+        """
+
+    def submit(self, code, on_output=None):
+        """Queue ``code``; ``on_output(chunk)`` is called as output arrives."""
+        job = Job(code, on_output)
+        self._threads.submit(self._run, job)
+        return job
+
+    def run(self, code):
+        return self.submit(code).result()
+
+    def _run(self, job):
+        if not job.future.set_running_or_notify_cancel():
+            return
+        started = time.perf_counter()
+        chunks = []
+        ok = True
+        try:
+            try:
+                for chunk in self.execute(job.code, job.cancelled):
+                    if job.cancelled.is_set():
+                        raise CancelledError()
+                    chunks.append(chunk)
+                    if job.on_output is not None:
+                        job.on_output(chunk)
+                if job.cancelled.is_set():
+                    raise CancelledError()
+            except SnippetError as error:
+                ok = False
+                chunks.append(str(error))
+        except BaseException as error:
+            job.future.set_exception(error)
+            return
+        job.future.set_result(
+            Execution(ok, "".join(chunks), started - job.submitted, time.perf_counter() - started)
+        )
+
+
+class JuliaExecutor(Executor):
+    """Runs the code on the process-wide pool of warm Julia workers."""
+
+    def __init__(self, concurrency=None):
+        super().__init__(concurrency or int(os.environ.get("JULIA_POOL_SIZE", 2)))
+
+    def start(self):
+        workers.pool()
+
+    @property
+    def runtime(self):
+        pool = workers.pool()
+        return f"julia {pool.version} using {','.join(pool.preload)}"
+
+    def execute(self, code, cancelled):
+        # The workers answer with the whole output at once. Cancelling kills
+        # the worker running the snippet.
+        result = workers.pool().run(code, cancelled)
+        if result is workers.CANCELLED:
+            return
+        if not result.ok:
+            raise SnippetError(result.output)
+        yield result.output
+
+
+class ReplayExecutor(Executor):
+    """Replays the catalog's expected output for known snippets.
+
+    Each run takes ``latency`` seconds, spread evenly over the output's
+    lines as they are yielded, so runs are repeatable and need no Julia.
+    """
+
+    def __init__(self, latency=0.2, concurrency=2):
+        super().__init__(concurrency)
+        self.latency = latency
+        self.outputs = {
+            content["code"]: content["output"]
+            for locale in catalog.LOCALES
+            for section in catalog.SECTIONS
+            for content in catalog.examples(locale, section).values()
+        }
+
+    def execute(self, code, cancelled):
+        if code not in self.outputs:
+            raise SnippetError("No recorded output for this snippet.")
+        lines = self.outputs[code].splitlines(keepends=True) or [""]
+        for line in lines:
+            if cancelled.wait(self.latency / len(lines)):
+                return
+            yield line
+
+
+BACKENDS = {"julia": JuliaExecutor, "replay": ReplayExecutor}
+
+
+_EXECUTOR_LOCK = threading.Lock()
+_executor = None
+
+
+def executor():
+    """Return the process-wide executor chosen by ``JULIA_EXECUTOR``."""
+    global _executor
+    if _executor is None:
+        with _EXECUTOR_LOCK:
+            if _executor is None:
+                backend = os.environ.get("JULIA_EXECUTOR", "julia")
+                if backend == "replay":
+                    _executor = ReplayExecutor(latency=float(os.environ.get("JULIA_REPLAY_LATENCY", 0.2)))
+                else:
+                    _executor = BACKENDS[backend]()
+    return _executor
+
+
+def load_test(backend, clients, runs):
+    """Submit ``runs`` catalog snippets from ``clients`` threads; return the executions."""
+    snippets = [
+        content["code"]
+        for locale in catalog.LOCALES
+        for section in catalog.SECTIONS
+        for content in catalog.examples(locale, section).values()
+    ]
+    with ThreadPoolExecutor(clients) as pool:
+        return list(pool.map(lambda i: backend.run(snippets[i % len(snippets)]), range(runs)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test an executor backend.")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="replay")
+    parser.add_argument("--clients", type=int, default=20, help="concurrent submitters")
+    parser.add_argument("--runs", type=int, default=200, help="snippets to run in total")
+    parser.add_argument("--concurrency", type=int, default=2, help="snippets run at once")
+    parser.add_argument("--latency", type=float, default=0.2, help="replay seconds per run")
+    args = parser.parse_args(argv)
+
+    if args.backend == "replay":
+        backend = ReplayExecutor(args.latency, args.concurrency)
+    else:
+        backend = JuliaExecutor(args.concurrency)
+
+    start = time.perf_counter()
+    executions = load_test(backend, args.clients, args.runs)
+    total = time.perf_counter() - start
+
+    def quantiles(values):
+        cuts = statistics.quantiles(values, n=20)
+        return f"p50 {statistics.median(values):.3f}s  p95 {cuts[18]:.3f}s  max {max(values):.3f}s"
+
+    print(f"{len(executions)} runs in {total:.2f}s ({len(executions) / total:.1f} runs/s)")
+    print(f"queued   {quantiles([e.queued for e in executions])}")
+    print(f"running  {quantiles([e.elapsed for e in executions])}")
+    failed = sum(not e.ok for e in executions)
+    if failed:
+        print(f"{failed} runs failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Offline exports of the guide content."""
@@ -0,0 +1,104 @@
+"""Jupyter notebook export of the example catalog.
+
+Writes one notebook per section and locale, with a markdown heading and
+the rules for every example and a Julia code cell carrying the expected
+output::
+
+    python -m julia_guide.export.notebooks notebooks/
+
+Sections are written in parallel, one task per (locale, section).
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from julia_guide import catalog, sections
+
+KERNEL = {"name": "julia-1.10", "display_name": "Julia 1.10", "language": "julia"}
+
+
+def _lines(text):
+    # nbformat stores multi-line strings as a list of lines.
+    return text.splitlines(keepends=True)
+
+
+def _markdown(text):
+    return {"cell_type": "markdown", "metadata": {}, "source": _lines(text)}
+
+
+def _code(source, output):
+    return {
+        "cell_type": "code",
+        "execution_count": None,
+        "metadata": {},
+        "source": _lines(source),
+        "outputs": [{"output_type": "stream", "name": "stdout", "text": _lines(output)}],
+    }
+
+
+def notebook(locale, section, kernel=KERNEL):
+    """Return the notebook for one section as an nbformat 4 dict."""
+    cells = [_markdown(f"# {sections.label(locale, section)}")]
+    for title, content in catalog.examples(locale, section).items():
+        cells.append(_markdown(f"## {title}"))
+        cells.append(_code(content["code"], content["output"]))
+        cells.append(_markdown(content["rules"]))
+    for number, cell in enumerate(cells):
+        # nbformat 4.5 requires cell ids; numbering them keeps re-exports stable.
+        cell["id"] = f"{section}-{number}"
+    return {
+        "cells": cells,
+        "metadata": {
+            "kernelspec": dict(kernel),
+            "language_info": {"name": "julia", "file_extension": ".jl", "mimetype": "application/julia"},
+        },
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+
+
+def path_for(out_dir, locale, section):
+    return os.path.join(out_dir, locale, f"{catalog.SECTIONS.index(section) + 1:02d}_{section}.ipynb")
+
+
+def write_notebook(out_dir, locale, section, kernel=KERNEL):
+    path = path_for(out_dir, locale, section)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(notebook(locale, section, kernel), f, ensure_ascii=False, indent=1)
+        f.write("\n")
+    return path
+
+
+def export(out_dir, kernel=KERNEL, jobs=None):
+    """Write every non-empty section of both locales; return the written paths."""
+    tasks = [
+        (locale, section)
+        for locale in catalog.LOCALES
+        for section in catalog.SECTIONS
+        if catalog.examples(locale, section)
+    ]
+    for locale in catalog.LOCALES:
+        os.makedirs(os.path.join(out_dir, locale), exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(write_notebook, out_dir, locale, section, kernel) for locale, section in tasks]
+        return [future.result() for future in futures]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the examples as Jupyter notebooks.")
+    parser.add_argument("out_dir", help="directory to write the notebooks to")
+    parser.add_argument("--kernel", default=KERNEL["name"], help="Julia kernel name, e.g. julia-1.10")
+    parser.add_argument("--kernel-display-name", default=KERNEL["display_name"])
+    parser.add_argument("--jobs", type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    kernel = dict(KERNEL, name=args.kernel, display_name=args.kernel_display_name)
+    paths = export(args.out_dir, kernel, args.jobs)
+    print(f"Wrote {len(paths)} notebooks to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
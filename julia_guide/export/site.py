@@ -0,0 +1,255 @@
+"""Static-site export of the whole guide.
+
+Writes every section of both locales as plain HTML pages that any web
+server can serve from disk::
+
+    python -m julia_guide.export.site site/ --app-url https://guide.example.org/
+
+Charts are embedded as Plotly JSON and drawn by a local copy of plotly.js.
+The stylesheets and plotly.js are written once under ``assets/`` and
+shared by every page. The calculator and the condition tester need a
+server, so their pages link to the live app instead when ``--app-url``
+is given.
+"""
+
+import argparse
+import html
+import os
+import re
+import textwrap
+from urllib.parse import urlencode
+
+from julia_guide import catalog, figures, highlight, sections, theme
+from julia_guide.cards import LABELS, output_html, rules_body
+
+TEXT = {
+    "ar": {
+        "live": "🔗 افتح النسخة التفاعلية",
+        "run": "▶️ تشغيل في التطبيق",
+    },
+    "en": {
+        "live": "🔗 Open the interactive version",
+        "run": "▶️ Run in the app",
+    },
+}
+
+DIRECTION = {"ar": "rtl", "en": "ltr"}
+
+# Layout for the static pages; the look itself comes from theme.CSS.
+SITE_CSS = """body {
+    margin: 0;
+    font-family: 'Arial', sans-serif;
+    background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+}
+.layout { display: flex; min-height: 100vh; }
+nav { flex: 0 0 16rem; padding: 2rem 1rem; background: #ffffffcc; }
+nav a { display: block; padding: 0.3rem 0; color: #2d3748; text-decoration: none; }
+nav a.current { font-weight: bold; color: #667eea; }
+main { flex: 1; padding: 2rem; min-width: 0; }
+.row { display: flex; gap: 1.5rem; }
+.row > .column { flex: 1; min-width: 0; }
+.example { background: white; border-radius: 10px; padding: 0.5rem 1rem; margin: 1rem 0; }
+.example summary { cursor: pointer; font-weight: bold; }
+.rules { white-space: pre-line; }
+.chart { width: 100%; min-height: 400px; }
+.code-block pre { direction: ltr; text-align: left; overflow-x: auto; padding: 1rem; }
+"""
+
+ASSETS = "../assets"
+
+CURRENT = " class='current'"
+
+
+def page_name(section):
+    return "index.html" if section == "introduction" else f"{section}.html"
+
+
+def markdown_html(text):
+    """Convert the small markdown subset the pages use (headings, rules, bold)."""
+    lines = []
+    for line in textwrap.dedent(text).strip().splitlines():
+        heading = re.match(r"(#{1,6})\s+(.*)", line.strip())
+        if heading:
+            level = len(heading.group(1))
+            line = f"<h{level}>{heading.group(2)}</h{level}>"
+        elif line.strip() == "---":
+            line = "<hr>"
+        lines.append(re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", line))
+    return "\n".join(lines)
+
+
+def app_link(app_url, **params):
+    return f"{app_url}?{urlencode(params)}"
+
+
+class Page:
+    """Collects what a section draws and renders it as static HTML.
+
+    Section modules fill it from their ``export(locale, page)`` function,
+    mirroring the calls their ``render(locale)`` makes to Streamlit.
+    """
+
+    def __init__(self, locale, section, app_url=None, counter=None):
+        self.locale = locale
+        self.section = section
+        self.app_url = app_url
+        self.parts = []
+        self._counter = counter if counter is not None else [0]
+
+    def markdown(self, text):
+        self.parts.append(markdown_html(text))
+
+    def info(self, text):
+        self.parts.append(f"<div class='info-box'>{html.escape(text)}</div>")
+
+    def image(self, url, caption):
+        self.parts.append(
+            f"<figure><img src='{html.escape(url)}' alt='' style='max-width: 100%;'>"
+            f"<figcaption>{html.escape(caption)}</figcaption></figure>"
+        )
+
+    def columns(self, count):
+        columns = [Page(self.locale, self.section, self.app_url, self._counter) for _ in range(count)]
+        self.parts.append(columns)
+        return columns
+
+    def code(self, source):
+        self.parts.append(highlight.html(source))
+
+    def chart(self, builder, locale, data):
+        _, payload = figures.get(builder, locale, data)
+        self._counter[0] += 1
+        chart_id = f"chart-{self._counter[0]}"
+        payload = payload.replace("</", "<\\/")
+        self.parts.append(
+            f"<div class='chart' id='{chart_id}'></div>\n"
+            f"<script>(function () {{ var fig = {payload}; "
+            f"Plotly.newPlot('{chart_id}', fig.data, fig.layout, {{responsive: true}}); }})();</script>"
+        )
+
+    def live(self):
+        # Interactive widgets only exist in the Streamlit app.
+        if self.app_url:
+            url = app_link(self.app_url, lang=self.locale, section=self.section)
+            self.parts.append(f"<p><a href='{html.escape(url)}'>{TEXT[self.locale]['live']}</a></p>")
+
+    def examples(self, section, expanded=False):
+        labels = LABELS[self.locale]
+        for title, content in catalog.examples(self.locale, section).items():
+            rules_html = markdown_html(rules_body(content["rules"]))
+            run = ""
+            if self.app_url:
+                url = app_link(self.app_url, lang=self.locale, section=section, example=title)
+                run = f"<p><a href='{html.escape(url)}'>{TEXT[self.locale]['run']}</a></p>"
+            self.parts.append(
+                f"<details class='example'{' open' if expanded else ''}>"
+                f"<summary>{html.escape(title)}</summary>\n"
+                "<div class='row'>\n"
+                f"<div class='column'>{markdown_html(labels['code'])}\n{highlight.html(content['code'])}{run}</div>\n"
+                f"<div class='column'>{markdown_html(labels['output'])}\n"
+                f"{output_html(content['output'])}\n"
+                f"{markdown_html(labels['rules'])}\n<div class='info-box rules'>{rules_html}</div></div>\n"
+                "</div></details>"
+            )
+
+    def render(self):
+        out = []
+        for part in self.parts:
+            if isinstance(part, list):
+                out.append("<div class='row'>")
+                out.extend(f"<div class='column'>\n{column.render()}\n</div>" for column in part)
+                out.append("</div>")
+            else:
+                out.append(part)
+        return "\n".join(out)
+
+
+def render_page(locale, section, app_url=None):
+    page = Page(locale, section, app_url)
+    sections.load(section).export(locale, page)
+
+    other = "en" if locale == "ar" else "ar"
+    nav = "\n".join(
+        f"<a href='{page_name(key)}'{CURRENT if key == section else ''}>{html.escape(label)}</a>"
+        for key, label in sections.MENU[locale].items()
+    )
+    return f"""<!DOCTYPE html>
+<html lang="{locale}" dir="{DIRECTION[locale]}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(sections.label(locale, section))} · {html.escape(theme.PAGE_TITLE[locale])}</title>
+<link rel="stylesheet" href="{ASSETS}/site.css">
+<link rel="stylesheet" href="{ASSETS}/{locale}.css">
+<link rel="stylesheet" href="{ASSETS}/highlight.css">
+<script src="{ASSETS}/plotly.min.js"></script>
+</head>
+<body>
+<div class="layout">
+<nav>
+{markdown_html(theme.MENU_TITLE[locale])}
+<hr>
+{nav}
+<hr>
+<a href="../{other}/{page_name(section)}">{theme.LANGUAGES[other]}</a>
+</nav>
+<main class="block-container">
+{theme.HEADER[locale]}
+{page.render()}
+<hr>
+{theme.FOOTER[locale]}
+</main>
+</div>
+</body>
+</html>
+"""
+
+
+def write_assets(out_dir):
+    from plotly.offline import get_plotlyjs
+
+    assets = os.path.join(out_dir, "assets")
+    os.makedirs(assets, exist_ok=True)
+    files = {
+        "site.css": SITE_CSS,
+        "highlight.css": highlight.CSS,
+        "plotly.min.js": get_plotlyjs(),
+    }
+    for locale in catalog.LOCALES:
+        files[f"{locale}.css"] = theme.CSS[locale] + theme.CHROME_CSS
+    for name, content in files.items():
+        with open(os.path.join(assets, name), "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def export(out_dir, app_url=None):
+    """Write the whole site to ``out_dir`` and return the number of pages."""
+    write_assets(out_dir)
+    count = 0
+    for locale in catalog.LOCALES:
+        os.makedirs(os.path.join(out_dir, locale), exist_ok=True)
+        for section in sections.MENU[locale]:
+            with open(os.path.join(out_dir, locale, page_name(section)), "w", encoding="utf-8") as f:
+                f.write(render_page(locale, section, app_url))
+            count += 1
+
+    links = "\n".join(
+        f"<p><a href='{locale}/index.html'>{html.escape(theme.PAGE_TITLE[locale])}</a></p>"
+        for locale in catalog.LOCALES
+    )
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(f"<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"></head>\n<body>\n{links}\n</body>\n</html>\n")
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the guide as a static HTML site.")
+    parser.add_argument("out_dir", help="directory to write the site to")
+    parser.add_argument("--app-url", help="URL of the live Streamlit app, for the interactive widgets")
+    args = parser.parse_args(argv)
+    count = export(args.out_dir, args.app_url)
+    print(f"Wrote {count} pages to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Process-wide cache of the static Plotly charts.
+
+Each chart is built once per locale and shared read-only by every session,
+together with its JSON payload. Entries are keyed by a digest of the data
+the chart is drawn from, so editing the numbers or labels rebuilds the
+figure on the next rerun instead of serving a stale one.
+"""
+
+import hashlib
+import threading
+
+import streamlit as st
+
+_LOCK = threading.Lock()
+_CACHE = {}
+
+
+def data_key(data):
+    return hashlib.sha1(repr(data).encode("utf-8")).hexdigest()
+
+
+def get(builder, locale, data):
+    """Return ``(figure, payload)`` for ``builder(locale)``, building it at most once."""
+    name = f"{builder.__module__}.{builder.__qualname__}"
+    key = data_key(data)
+    entry = _CACHE.get((name, locale))
+    if entry is None or entry[0] != key:
+        with _LOCK:
+            entry = _CACHE.get((name, locale))
+            if entry is None or entry[0] != key:
+                figure = builder(locale)
+                entry = (key, figure, figure.to_json())
+                _CACHE[(name, locale)] = entry
+    return entry[1], entry[2]
+
+
+def chart(builder, locale, data):
+    figure, _ = get(builder, locale, data)
+    st.plotly_chart(figure, use_container_width=True)
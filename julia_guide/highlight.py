@@ -0,0 +1,77 @@
+"""Server-side syntax highlighting for the Julia snippets.
+
+Each snippet is highlighted with Pygments once per process and cached as
+HTML under a digest of its source. Identical code in both locales shares
+one entry, and browsers receive ready-coloured markup instead of
+tokenizing every code block themselves.
+"""
+
+import hashlib
+
+import streamlit as st
+from pygments import highlight as _highlight
+from pygments.filter import simplefilter
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import JuliaLexer
+from pygments.token import Text
+
+from julia_guide import catalog
+
+_FORMATTER = HtmlFormatter(cssclass="code-block", style="monokai")
+
+
+def _is_plain(ttype):
+    while ttype not in _FORMATTER.ttype2class:
+        ttype = ttype.parent
+    return _FORMATTER.class2style[_FORMATTER.ttype2class[ttype]][0] == _FORMATTER.class2style[""][0]
+
+
+@simplefilter
+def _plain_as_text(self, lexer, stream, options):
+    # Tokens drawn in the default colour need no <span>: as plain text the
+    # formatter merges them with their neighbours, which roughly halves the
+    # markup sent for every code block.
+    for ttype, value in stream:
+        yield (Text if _is_plain(ttype) else ttype), value
+
+
+_LEXER = JuliaLexer()
+_LEXER.add_filter(_plain_as_text())
+
+# Token colours, scoped to the existing .code-block class.
+CSS = "\n".join(
+    line for line in _FORMATTER.get_style_defs(".code-block").splitlines()
+    if line.startswith(".code-block")
+) + "\n"
+
+_CACHE = {}
+
+
+def code_key(source):
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def html(source):
+    """Return the highlighted HTML for ``source``, highlighting it at most once."""
+    key = code_key(source)
+    cached = _CACHE.get(key)
+    if cached is None:
+        cached = _CACHE[key] = _highlight(source, _LEXER, _FORMATTER)
+    return cached
+
+
+def forget(source):
+    _CACHE.pop(code_key(source), None)
+
+
+@catalog.on_change
+def _forget_changed(locale, changes):
+    for old, new in changes.values():
+        if old is not None and (new is None or new["code"] != old["code"]):
+            forget(old["code"])
+
+
+def code(source):
+    # st.html rather than st.markdown: blank lines inside <pre> would end
+    # the HTML block for the markdown parser.
+    st.html(html(source))
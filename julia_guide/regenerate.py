@@ -0,0 +1,136 @@
+"""Regenerate every example's ``output`` by running its code.
+
+Runs all examples of both locales on a few long-lived Julia workers, so
+packages are loaded once per worker rather than once per example, and
+writes the real output back into ``julia_guide/content/<locale>.py``::
+
+    python -m julia_guide.regenerate --jobs 4 --preload DataFrames,Printf,Statistics
+
+Only the ``output`` literals are rewritten; the rest of each file is left
+byte for byte. Examples that fail keep their current output and are
+listed, and the command then exits with a non-zero status.
+"""
+
+import argparse
+import ast
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from julia_guide import catalog, workers
+
+PRELOAD = ("DataFrames",) + workers.PRELOAD
+
+
+def all_examples():
+    """Return ``{(locale, section, title): code}`` for the whole catalog."""
+    return {
+        (locale, section, title): content["code"]
+        for locale in catalog.LOCALES
+        for section in catalog.SECTIONS
+        for title, content in catalog.examples(locale, section).items()
+    }
+
+
+def run_examples(pool, examples):
+    """Run ``examples`` on every worker of ``pool`` at once; return their Results by key."""
+    with ThreadPoolExecutor(pool.size) as threads:
+        return dict(zip(examples, threads.map(pool.run, examples.values())))
+
+
+def run_all(jobs=4, preload=PRELOAD, julia="julia", timeout=120):
+    """Run every example; return ``{(locale, section, title): Result}``."""
+    pool = workers.JuliaPool(size=jobs, timeout=timeout, julia=julia, preload=preload)
+    return run_examples(pool, all_examples())
+
+
+def literal(text):
+    """Write ``text`` the way the content modules do: as a triple-quoted string."""
+    if "\\" in text or '"""' in text or text.endswith('"'):
+        return repr(text)
+    return f'"""{text}"""'
+
+
+def output_nodes(tree):
+    """Yield ``(section, title, node)`` for every ``output`` literal in EXAMPLES."""
+    for statement in tree.body:
+        if not (
+            isinstance(statement, ast.Assign)
+            and any(isinstance(target, ast.Name) and target.id == "EXAMPLES" for target in statement.targets)
+        ):
+            continue
+        for section, entries in zip(statement.value.keys, statement.value.values):
+            for title, content in zip(entries.keys, entries.values):
+                for field, value in zip(content.keys, content.values):
+                    if field.value == "output":
+                        yield section.value, title.value, value
+
+
+def rewrite(locale, outputs):
+    """Replace the ``output`` literals of ``locale`` with ``outputs[(section, title)]``.
+
+    Returns the number of examples whose output changed.
+    """
+    path = os.path.join(catalog.CONTENT_DIR, f"{locale}.py")
+    with open(path, "rb") as f:
+        source = f.read()
+    lines = source.splitlines(keepends=True)
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+
+    edits = []
+    for section, title, node in output_nodes(ast.parse(source, path)):
+        new = outputs.get((section, title))
+        if new is None or new == node.value:
+            continue
+        # ast offsets are UTF-8 byte columns, so edit the bytes.
+        start = offsets[node.lineno - 1] + node.col_offset
+        end = offsets[node.end_lineno - 1] + node.end_col_offset
+        edits.append((start, end, literal(new).encode("utf-8")))
+
+    for start, end, replacement in sorted(edits, reverse=True):
+        source = source[:start] + replacement + source[end:]
+    if edits:
+        with open(path, "wb") as f:
+            f.write(source)
+    return len(edits)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate the examples' output by running them.")
+    parser.add_argument("--jobs", type=int, default=4, help="Julia workers to run in parallel")
+    parser.add_argument("--preload", default=",".join(PRELOAD), help="packages each worker loads once")
+    parser.add_argument("--julia", default=os.environ.get("JULIA_BIN", "julia"), help="Julia executable")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing the content modules")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.jobs, tuple(filter(None, args.preload.split(","))), args.julia)
+    failed = [key for key, result in results.items() if not result.ok]
+    for locale, section, title in failed:
+        print(f"{locale}/{section}/{title}: {results[locale, section, title].output.strip()}")
+
+    total = 0
+    for locale in catalog.LOCALES:
+        outputs = {
+            (section, title): result.output.rstrip("\n")
+            for (loc, section, title), result in results.items()
+            if loc == locale and result.ok
+        }
+        if args.dry_run:
+            changed = sum(
+                output != catalog.examples(locale, section)[title]["output"]
+                for (section, title), output in outputs.items()
+            )
+        else:
+            changed = rewrite(locale, outputs)
+        total += changed
+        print(f"{locale}: {changed} outputs {'would change' if args.dry_run else 'updated'}")
+
+    if total and not args.dry_run and os.path.exists(catalog.BUNDLE):
+        print("Content changed: rebuild the bundle with python -m julia_guide.bundle")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Persistent, content-addressed cache of execution results.
+
+The examples are deterministic, so a snippet only needs to run once per
+runtime. Results are stored in a SQLite file shared by every server
+process on the host, keyed by a digest of the code and the executor's
+runtime (Julia version and preloaded packages). Recent hits are also
+kept in memory, so repeated clicks never touch the disk. Identical
+snippets requested at the same time in one process run once and share
+the result.
+
+``JULIA_RESULT_CACHE`` sets the file (default
+``~/.cache/julia-guide/results.sqlite3``) and ``JULIA_RESULT_CACHE_BYTES``
+its size; the least recently used results are evicted beyond it. If the
+file cannot be opened, read or written, snippets still run, uncached.
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from julia_guide import executors
+
+MAX_BYTES = 64 * 1024 * 1024
+
+# Results kept in memory in front of the file.
+MEMORY_ENTRIES = 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    output TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_used ON results (used);
+"""
+
+
+def result_key(code, runtime):
+    return hashlib.sha256(f"{runtime}\0{code}".encode("utf-8")).hexdigest()
+
+
+def default_path():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "julia-guide", "results.sqlite3")
+
+
+class ResultCache:
+    def __init__(self, path, max_bytes=MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._pending = {}
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    def _connect(self):
+        # One connection per thread; WAL lets processes read while one writes.
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = sqlite3.connect(self.path, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def _recall(self, key):
+        with self._lock:
+            output = self._memory.get(key)
+            if output is not None:
+                self._memory.move_to_end(key)
+            return output
+
+    def _remember(self, key, output):
+        with self._lock:
+            self._memory[key] = output
+            self._memory.move_to_end(key)
+            if len(self._memory) > MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached output for ``key``, or None."""
+        output = self._recall(key)
+        if output is not None:
+            return output
+        try:
+            with self._connect() as db:
+                row = db.execute("SELECT output FROM results WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error as error:
+            _unavailable(error)
+            return None
+        self._remember(key, row[0])
+        return row[0]
+
+    def put(self, key, output):
+        size = len(output.encode("utf-8"))
+        try:
+            with self._connect() as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO results (key, output, size, used) VALUES (?, ?, ?, ?)",
+                    (key, output, size, time.time()),
+                )
+                total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+                if total > self.max_bytes:
+                    self._evict(db, total - self.max_bytes)
+        except sqlite3.Error as error:
+            _unavailable(error)
+        self._remember(key, output)
+
+    def _evict(self, db, excess):
+        freed = 0
+        evicted = []
+        for key, size in db.execute("SELECT key, size FROM results ORDER BY used"):
+            if freed >= excess:
+                break
+            evicted.append((key,))
+            freed += size
+        db.executemany("DELETE FROM results WHERE key = ?", evicted)
+
+    def run(self, code, executor):
+        """Return an Execution for ``code``, running it only on a miss.
+
+        Only successful runs are stored: a failure may come from a timeout
+        or a missing package rather than from the code.
+        """
+        start = time.perf_counter()
+        key = result_key(code, executor.runtime)
+        output = self._recall(key)
+        if output is not None:
+            return executors.Execution(True, output, 0.0, time.perf_counter() - start)
+
+        # Join a run of the same snippet that is already under way before
+        # looking at the file, so concurrent misses share one execution.
+        with self._lock:
+            pending = self._pending.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._pending[key] = Future()
+        if not owner:
+            return pending.result()
+
+        try:
+            # An owner that finished just before we registered has stored
+            # its result by now.
+            output = self.get(key)
+            if output is not None:
+                execution = executors.Execution(True, output, 0.0, time.perf_counter() - start)
+            else:
+                execution = executor.run(code)
+                if execution.ok:
+                    self.put(key, execution.output)
+            pending.set_result(execution)
+            return execution
+        except BaseException as error:
+            pending.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+
+
+_CACHE_LOCK = threading.Lock()
+_cache = None
+
+
+def cache():
+    """Return the process-wide result cache."""
+    global _cache
+    if _cache is None:
+        with _CACHE_LOCK:
+            if _cache is None:
+                _cache = ResultCache(
+                    os.environ.get("JULIA_RESULT_CACHE") or default_path(),
+                    int(os.environ.get("JULIA_RESULT_CACHE_BYTES", MAX_BYTES)),
+                )
+    return _cache
+
+
+def _unavailable(error):
+    print(f"Result cache unavailable, running uncached: {error}", file=sys.stderr)
+
+
+def run(code):
+    """Run ``code`` on the process-wide executor through the result cache."""
+    try:
+        store = cache()
+    except (OSError, sqlite3.Error) as error:
+        _unavailable(error)
+        return executors.executor().run(code)
+    return store.run(code, executors.executor())
@@ -0,0 +1,84 @@
+"""Lazily imported section pages.
+
+Each section is a module exposing ``render(locale)``. A module is imported
+the first time its section is selected and then stays in ``sys.modules``,
+so later reruns only execute the selected page.
+
+Pages can be deep-linked with ``?section=<id>&example=<title>``; a link
+with an example renders only that example's card.
+"""
+
+import importlib
+
+import streamlit as st
+
+from julia_guide import cards, catalog
+
+MENU = {
+    "ar": {
+        "introduction": "🏠 مقدمة عن Julia",
+        "basics": "📝 الأساسيات",
+        "data_types": "🔢 أنواع البيانات",
+        "arithmetic": "➕ العمليات الحسابية",
+        "loops": "🔄 الحلقات التكرارية",
+        "conditionals": "⚖️ الشروط",
+        "arrays": "📊 المصفوفات والجداول",
+        "plotting": "📈 الرسوم البيانية",
+        "functions": "🎲 الدوال",
+        "packages": "📦 الحزم الاقتصادية",
+        "errors": "🔍 معالجة الأخطاء",
+        "applications": "💼 تطبيقات اقتصادية",
+    },
+    "en": {
+        "introduction": "🏠 Introduction to Julia",
+        "basics": "📝 Basics",
+        "data_types": "🔢 Data Types",
+        "arithmetic": "➕ Arithmetic Operations",
+        "loops": "🔄 Loops",
+        "conditionals": "⚖️ Conditionals",
+        "arrays": "📊 Arrays & DataFrames",
+        "plotting": "📈 Plotting",
+        "functions": "🎲 Functions",
+        "packages": "📦 Economic Packages",
+        "errors": "🔍 Error Handling",
+        "applications": "💼 Economic Applications",
+    },
+}
+
+
+def label(locale, section):
+    return MENU[locale][section]
+
+
+def load(section):
+    if section not in catalog.SECTIONS:
+        raise KeyError(f"Unknown section: {section!r}")
+    return importlib.import_module(f"{__name__}.{section}")
+
+
+def linked(locale):
+    """Return the ``(section, example)`` named in the query string.
+
+    Unknown values are ignored, so a stale link falls back to the normal page.
+    """
+    section = st.query_params.get("section")
+    if section not in MENU[locale]:
+        return None, None
+    example = st.query_params.get("example")
+    if example not in catalog.examples(locale, section):
+        example = None
+    return section, example
+
+
+def follow_menu():
+    # Keep the address bar in step with the sidebar so it is always a
+    # shareable link to the current section.
+    st.query_params["section"] = st.session_state["menu"]
+    st.query_params.pop("example", None)
+
+
+def render(locale, section, example=None):
+    if example is not None:
+        cards.render_example(locale, section, example)
+    else:
+        load(section).render(locale)
@@ -0,0 +1,42 @@
+"""Shared body of the sections that are still under construction."""
+
+import base64
+
+import streamlit as st
+
+from julia_guide import sections
+
+TEXT = {
+    "ar": {
+        "info": "هذا القسم قيد الإنشاء. يرجى العودة لاحقاً!",
+        "caption": "سيتم إضافة محتوى هذا القسم قريباً.",
+    },
+    "en": {
+        "info": "This section is under construction. Please check back later!",
+        "caption": "Content for this section will be added soon.",
+    },
+}
+
+# Drawn locally so these sections never wait on an outside image host.
+# No "#" colours: Streamlit passes SVG markup through as an unencoded data URL.
+IMAGE = """<svg xmlns="http://www.w3.org/2000/svg" width="800" height="400" viewBox="0 0 800 400">
+<rect width="800" height="400" fill="rgb(204,204,204)"/>
+<text x="400" y="200" font-family="Arial, sans-serif" font-size="48" fill="rgb(150,150,150)"
+ text-anchor="middle" dominant-baseline="middle">Coming Soon</text>
+</svg>"""
+
+IMAGE_URL = "data:image/svg+xml;base64," + base64.b64encode(IMAGE.encode("utf-8")).decode("ascii")
+
+
+def render(locale, section):
+    text = TEXT[locale]
+    st.markdown(f"## {sections.label(locale, section)}")
+    st.info(text["info"])
+    st.image(IMAGE, caption=text["caption"])
+
+
+def export(locale, section, page):
+    text = TEXT[locale]
+    page.markdown(f"## {sections.label(locale, section)}")
+    page.info(text["info"])
+    page.image(IMAGE_URL, text["caption"])
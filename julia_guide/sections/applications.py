@@ -0,0 +1,11 @@
+"""Section 12: Economic Applications (under construction)."""
+
+from julia_guide.sections import _placeholder
+
+
+def render(locale):
+    _placeholder.render(locale, "applications")
+
+
+def export(locale, page):
+    _placeholder.export(locale, "applications", page)
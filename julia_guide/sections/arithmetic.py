@@ -0,0 +1,122 @@
+"""Section 4: Arithmetic Operations."""
+
+import streamlit as st
+
+from julia_guide import cards
+
+TEXT = {
+    "ar": {
+        "title": "## ➕ العمليات الحسابية المتقدمة",
+        "intro": """
+    <div class='info-box'>
+    <h3>العمليات الحسابية الأساسية والمتقدمة:</h3>
+    </div>
+    """,
+        "calculator": "### 🧮 آلة حاسبة تفاعلية",
+        "first_number": "الرقم الأول",
+        "operation": "العملية",
+        "second_number": "الرقم الثاني",
+        "calculate": "احسب",
+        "operations": {
+            "+": "الجمع",
+            "-": "الطرح",
+            "*": "الضرب",
+            "/": "القسمة",
+            "^": "الأس",
+            "%": "باقي القسمة",
+            "//": "القسمة الصحيحة",
+        },
+        "divide_by_zero": "⚠️ خطأ: لا يمكن القسمة على صفر!",
+        "result": "### نتيجة {op_name}: {result:.2f}",
+    },
+    "en": {
+        "title": "## ➕ Advanced Arithmetic Operations",
+        "intro": """
+    <div class='info-box'>
+    <h3>Basic and Advanced Arithmetic Operations:</h3>
+    </div>
+    """,
+        "calculator": "### 🧮 Interactive Calculator",
+        "first_number": "First Number",
+        "operation": "Operation",
+        "second_number": "Second Number",
+        "calculate": "Calculate",
+        "operations": {
+            "+": "Addition",
+            "-": "Subtraction",
+            "*": "Multiplication",
+            "/": "Division",
+            "^": "Exponentiation",
+            "%": "Remainder",
+            "//": "Integer Division",
+        },
+        "divide_by_zero": "⚠️ Error: Cannot divide by zero!",
+        "result": "### Result of {op_name}: {result:.2f}",
+    },
+}
+
+OPERATIONS = ["+", "-", "*", "/", "^", "%", "//"]
+
+
+def calculate(num1, operation, num2):
+    if operation == "+":
+        return num1 + num2
+    elif operation == "-":
+        return num1 - num2
+    elif operation == "*":
+        return num1 * num2
+    elif operation == "/":
+        return num1 / num2
+    elif operation == "^":
+        return num1 ** num2
+    elif operation == "%":
+        return num1 % num2
+    elif operation == "//":
+        return num1 // num2
+
+
+@st.fragment
+def calculator(locale):
+    # Runs as a fragment: editing the inputs or pressing Calculate reruns
+    # only this widget tree, not the example cards below it.
+    text = TEXT[locale]
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        num1 = st.number_input(text["first_number"], value=100.0, key="calc_num1")
+    with col2:
+        operation = st.selectbox(text["operation"], OPERATIONS, key="calc_op")
+    with col3:
+        num2 = st.number_input(text["second_number"], value=20.0, key="calc_num2")
+
+    if st.button(text["calculate"]):
+        if operation in ("/", "%", "//") and num2 == 0:
+            st.error(text["divide_by_zero"])
+        else:
+            result = calculate(num1, operation, num2)
+            st.success(text["result"].format(op_name=text["operations"][operation], result=result))
+
+
+def render(locale):
+    text = TEXT[locale]
+    st.markdown(text["title"])
+    st.markdown(text["intro"], unsafe_allow_html=True)
+
+    # Interactive calculator
+    st.markdown(text["calculator"])
+    calculator(locale)
+
+    st.markdown("---")
+
+    cards.render_examples(locale, "arithmetic")
+
+
+def export(locale, page):
+    text = TEXT[locale]
+    page.markdown(text["title"])
+    page.markdown(text["intro"])
+    page.markdown(text["calculator"])
+    page.live()
+    page.markdown("---")
+    page.examples("arithmetic")
@@ -0,0 +1,51 @@
+"""Section 7: Arrays and DataFrames."""
+
+import streamlit as st
+
+from julia_guide import cards
+
+TEXT = {
+    "ar": {
+        "title": "## 📊 المصفوفات والجداول (Arrays & DataFrames)",
+        "intro": """
+    <div class='info-box'>
+    <h3>العمل مع البيانات:</h3>
+    <ul style='font-size: 1.1rem; line-height: 1.8;'>
+    <li>📋 <strong>Arrays:</strong> مصفوفات أحادية ومتعددة الأبعاد</li>
+    <li>📊 <strong>DataFrames:</strong> جداول بيانات مثل Excel</li>
+    <li>🔧 <strong>Operations:</strong> عمليات على البيانات</li>
+    <li>📈 <strong>Analysis:</strong> تحليل البيانات الاقتصادية</li>
+    </ul>
+    </div>
+    """,
+    },
+    "en": {
+        "title": "## 📊 Arrays & DataFrames",
+        "intro": """
+    <div class='info-box'>
+    <h3>Working with Data:</h3>
+    <ul style='font-size: 1.1rem; line-height: 1.8;'>
+    <li>📋 <strong>Arrays:</strong> 1D and multi-dimensional arrays.</li>
+    <li>📊 <strong>DataFrames:</strong> Tabular data structures like in Excel or R.</li>
+    <li>🔧 <strong>Operations:</strong> Performing operations on data.</li>
+    <li>📈 <strong>Analysis:</strong> Analyzing economic data.</li>
+    </ul>
+    </div>
+    """,
+    },
+}
+
+
+def render(locale):
+    text = TEXT[locale]
+    st.markdown(text["title"])
+    st.markdown(text["intro"], unsafe_allow_html=True)
+
+    cards.render_examples(locale, "arrays")
+
+
+def export(locale, page):
+    text = TEXT[locale]
+    page.markdown(text["title"])
+    page.markdown(text["intro"])
+    page.examples("arrays")
@@ -0,0 +1,53 @@
+"""Section 2: Basics."""
+
+import streamlit as st
+
+from julia_guide import cards
+
+TEXT = {
+    "ar": {
+        "title": "## 📝 الأساسيات في Julia",
+        "intro": """
+    <div class='info-box'>
+    <h3>القواعد الأساسية:</h3>
+    <ul style='font-size: 1.1rem; line-height: 1.8;'>
+    <li>📌 استخدم <code>=</code> لتعيين القيم للمتغيرات</li>
+    <li>📌 استخدم <code>#</code> للتعليقات في سطر واحد</li>
+    <li>📌 استخدم <code>println()</code> للطباعة</li>
+    <li>📌 لا حاجة لنقطة فاصلة في نهاية السطر (اختيارية)</li>
+    <li>📌 استخدم <code>;</code> لإخفاء المخرجات</li>
+    </ul>
+    </div>
+    """,
+    },
+    "en": {
+        "title": "## 📝 Basics in Julia",
+        "intro": """
+    <div class='info-box'>
+    <h3>Basic Rules:</h3>
+    <ul style='font-size: 1.1rem; line-height: 1.8;'>
+    <li>📌 Use <code>=</code> to assign values to variables</li>
+    <li>📌 Use <code>#</code> for single-line comments</li>
+    <li>📌 Use <code>println()</code> to print</li>
+    <li>📌 Semicolons at the end of a line are not required (optional)</li>
+    <li>📌 Use <code>;</code> at the end of a line to suppress output in the REPL</li>
+    </ul>
+    </div>
+    """,
+    },
+}
+
+
+def render(locale):
+    text = TEXT[locale]
+    st.markdown(text["title"])
+    st.markdown(text["intro"], unsafe_allow_html=True)
+
+    cards.render_examples(locale, "basics", expanded=True)
+
+
+def export(locale, page):
+    text = TEXT[locale]
+    page.markdown(text["title"])
+    page.markdown(text["intro"])
+    page.examples("basics", expanded=True)
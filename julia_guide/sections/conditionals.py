@@ -0,0 +1,106 @@
+"""Section 6: Conditionals."""
+
+import streamlit as st
+
+from julia_guide import cards
+
+TEXT = {
+    "ar": {
+        "title": "## ⚖️ الشروط والجمل الشرطية",
+        "intro": """
+    <div class='info-box'>
+    <h3>أنواع الجمل الشرطية:</h3>
+    <ul style='font-size: 1.1rem; line-height: 1.8;'>
+    <li>✅ <strong>if:</strong> تنفيذ كود إذا كان الشرط صحيح</li>
+    <li>✅ <strong>elseif:</strong> شرط بديل</li>
+    <li>✅ <strong>else:</strong> تنفيذ إذا فشلت جميع الشروط</li>
+    <li>✅ <strong>العمليات المنطقية:</strong> &&، ||، !</li>
+    </ul>
+    </div>
+    """,
+        "tester": "### 🧪 اختبار الشروط التفاعلي",
+        "income": "الدخل الشهري",
+        "expenses": "النفقات الشهرية",
+        "result": "### النتيجة:",
+        "surplus": "✅ ممتاز! لديك فائض: {net_income}",
+        "surplus_tip": "يمكنك الادخار والاستثمار",
+        "small_surplus": "⚠️ جيد! لديك فائض صغير: {net_income}",
+        "small_surplus_tip": "حاول زيادة الادخار",
+        "deficit": "❌ تحذير! لديك عجز: {net_income}",
+        "deficit_tip": "راجع نفقاتك",
+    },
+    "en": {
+        "title": "## ⚖️ Conditionals",
+        "intro": """
+    <div class='info-box'>
+    <h3>Types of Conditional Statements:</h3>
+    <ul style='font-size: 1.1rem; line-height: 1.8;'>
+    <li>✅ <strong>if:</strong> Execute code if a condition is true.</li>
+    <li>✅ <strong>elseif:</strong> An alternative condition to check.</li>
+    <li>✅ <strong>else:</strong> Execute if all preceding conditions fail.</li>
+    <li>✅ <strong>Logical Operators:</strong> && (AND), || (OR), ! (NOT).</li>
+    </ul>
+    </div>
+    """,
+        "tester": "### 🧪 Interactive Condition Tester",
+        "income": "Monthly Income",
+        "expenses": "Monthly Expenses",
+        "result": "### Result:",
+        "surplus": "✅ Excellent! You have a surplus: {net_income}",
+        "surplus_tip": "You can save and invest.",
+        "small_surplus": "⚠️ Good! You have a small surplus: {net_income}",
+        "small_surplus_tip": "Try to increase your savings.",
+        "deficit": "❌ Warning! You have a deficit: {net_income}",
+        "deficit_tip": "Review your expenses.",
+    },
+}
+
+
+@st.fragment
+def condition_tester(locale):
+    # Runs as a fragment: changing income or expenses reruns only the
+    # tester, not the code examples below it.
+    text = TEXT[locale]
+
+    col1, col2 = st.columns(2)
+    with col1:
+        income = st.number_input(text["income"], min_value=0, value=5000, step=500, key="cond_income")
+        expenses = st.number_input(text["expenses"], min_value=0, value=3000, step=500, key="cond_expenses")
+
+    with col2:
+        st.markdown(text["result"])
+        net_income = income - expenses
+
+        if net_income > 2000:
+            st.success(text["surplus"].format(net_income=net_income))
+            st.info(text["surplus_tip"])
+        elif net_income > 0:
+            st.warning(text["small_surplus"].format(net_income=net_income))
+            st.info(text["small_surplus_tip"])
+        else:
+            st.error(text["deficit"].format(net_income=net_income))
+            st.info(text["deficit_tip"])
+
+
+def render(locale):
+    text = TEXT[locale]
+    st.markdown(text["title"])
+    st.markdown(text["intro"], unsafe_allow_html=True)
+
+    # Interactive condition tester
+    st.markdown(text["tester"])
+    condition_tester(locale)
+
+    st.markdown("---")
+
+    cards.render_examples(locale, "conditionals")
+
+
+def export(locale, page):
+    text = TEXT[locale]
+    page.markdown(text["title"])
+    page.markdown(text["intro"])
+    page.markdown(text["tester"])
+    page.live()
+    page.markdown("---")
+    page.examples("conditionals")
@@ -0,0 +1,91 @@
+"""Section 3: Data Types."""
+
+import streamlit as st
+
+from julia_guide import cards, figures
+
+TEXT = {
+    "ar": {
+        "title": "## 🔢 أنواع البيانات في Julia",
+        "intro": """
+    <div class='info-box'>
+    <h3>أنواع البيانات الرئيسية:</h3>
+    <p style='font-size: 1.1rem;'>
+    Julia لغة مكتوبة ديناميكياً (dynamically typed) لكنها قوية في التعامل مع الأنواع
+    </p>
+    </div>
+    """,
+        "table": {
+            "النوع": ["Int64", "Float64", "String", "Bool", "Array", "Dict"],
+            "الوصف": ["أعداد صحيحة", "أعداد عشرية", "نصوص", "منطقية", "مصفوفات", "قواميس"],
+            "مثال": ["42", "3.14", '"نص"', "true", "[1,2,3]", 'Dict("a"=>1)'],
+            "الاستخدام الاقتصادي": ["عدد الوحدات", "السعر", "اسم المنتج", "قرار شراء", "سلسلة زمنية", "بيانات مركبة"],
+        },
+        "chart_title": "جدول أنواع البيانات",
+    },
+    "en": {
+        "title": "## 🔢 Data Types in Julia",
+        "intro": """
+    <div class='info-box'>
+    <h3>Main Data Types:</h3>
+    <p style='font-size: 1.1rem;'>
+    Julia is a dynamically typed language, but it has a rich type system.
+    </p>
+    </div>
+    """,
+        "table": {
+            "Type": ["Int64", "Float64", "String", "Bool", "Array", "Dict"],
+            "Description": ["Integers", "Floating-point numbers", "Text", "Boolean", "Arrays", "Dictionaries"],
+            "Example": ["42", "3.14", '"text"', "true", "[1,2,3]", 'Dict("a"=>1)'],
+            "Economic Use Case": ["Number of units", "Price", "Product name", "Purchase decision", "Time series", "Composite data"],
+        },
+        "chart_title": "Data Types Table",
+    },
+}
+
+
+def types_figure(locale):
+    import plotly.graph_objects as go
+
+    table = TEXT[locale]["table"]
+
+    fig = go.Figure(data=[go.Table(
+        header=dict(
+            values=list(table),
+            fill_color='#667eea',
+            align='center',
+            font=dict(color='white', size=14, family='Arial'),
+            height=40
+        ),
+        cells=dict(
+            values=list(table.values()),
+            fill_color=[['#f7fafc', '#e2e8f0'] * 3],
+            align='center',
+            font=dict(color='#2d3748', size=12, family='Arial'),
+            height=35
+        )
+    )])
+
+    fig.update_layout(
+        title=dict(text=TEXT[locale]["chart_title"], font=dict(size=20)),
+        height=400
+    )
+    return fig
+
+
+def render(locale):
+    text = TEXT[locale]
+    st.markdown(text["title"])
+    st.markdown(text["intro"], unsafe_allow_html=True)
+
+    figures.chart(types_figure, locale, text)
+
+    cards.render_examples(locale, "data_types")
+
+
+def export(locale, page):
+    text = TEXT[locale]
+    page.markdown(text["title"])
+    page.markdown(text["intro"])
+    page.chart(types_figure, locale, text)
+    page.examples("data_types")
@@ -0,0 +1,11 @@
+"""Section 11: Error Handling (under construction)."""
+
+from julia_guide.sections import _placeholder
+
+
+def render(locale):
+    _placeholder.render(locale, "errors")
+
+
+def export(locale, page):
+    _placeholder.export(locale, "errors", page)
@@ -0,0 +1,81 @@
+"""Section 9: Functions."""
+
+import streamlit as st
+
+from julia_guide import cards
+
+TEXT = {
+    "ar": {
+        "title": "## 🎲 الدوال (Functions)",
+        "intro": """
+    <div class='info-box'>
+    <h3>أهمية الدوال:</h3>
+    <p style='font-size: 1.1rem; line-height: 1.8;'>
+    الدوال تساعدك على تنظيم الكود وإعادة استخدامه. في Julia، الدوال سريعة جداً وسهلة التعريف.
+    </p>
+    </div>
+    """,
+        "styles": """
+    <style>
+        /* Style for the code output block */
+        .output-block {
+            background-color: #f0f2f6; /* Light gray background */
+            border: 1px solid #dfe1e5;
+            border-radius: 8px;
+            padding: 1rem;
+            font-family: 'Consolas', 'Monaco', monospace;
+            color: #333;
+        }
+        .output-block pre {
+            white-space: pre-wrap; /* Ensures long lines wrap */
+            word-wrap: break-word;
+            margin: 0;
+        }
+        /* Style for the rules/info box */
+        .info-box {
+            background-color: #e8f0fe; /* Light blue background */
+            border: 1px solid #d2e3fc;
+            border-left: 5px solid #1a73e8; /* Blue left border */
+            border-radius: 8px;
+            padding: 1rem;
+            margin-top: 1rem;
+        }
+    </style>
+    """,
+        "heading": "Interactive Julia Guide for Economists",
+        "subheading": "### دليل Julia التفاعلي للاقتصاديين: الدوال (Functions)",
+    },
+    "en": {
+        "title": "## 🎲 Functions",
+        "intro": """
+    <div class='info-box'>
+    <h3>The Importance of Functions:</h3>
+    <p style='font-size: 1.1rem; line-height: 1.8;'>
+    Functions help you organize and reuse your code. In Julia, functions are very fast and easy to define.
+    </p>
+    </div>
+    """,
+    },
+}
+
+
+def render(locale):
+    text = TEXT[locale]
+    st.markdown(text["title"])
+    st.markdown(text["intro"], unsafe_allow_html=True)
+
+    # The Arabic page carries its own styling for the output and rules blocks.
+    if "styles" in text:
+        st.markdown(text["styles"], unsafe_allow_html=True)
+        st.title(text["heading"])
+        st.markdown(text["subheading"])
+        st.markdown("---")
+
+    cards.render_simulated_examples(locale, "functions")
+
+
+def export(locale, page):
+    text = TEXT[locale]
+    page.markdown(text["title"])
+    page.markdown(text["intro"])
+    page.examples("functions")
@@ -0,0 +1,145 @@
+"""Section 1: Introduction to Julia."""
+
+import streamlit as st
+
+from julia_guide import figures
+
+TEXT = {
+    "ar": {
+        "title": "## 🏠 مقدمة عن لغة Julia",
+        "about": """
+        <div class='info-box'>
+        <h3>ما هي Julia؟</h3>
+        <p style='font-size: 1.1rem; line-height: 1.8;'>
+        Julia هي لغة برمجة حديثة عالية الأداء مصممة خصيصاً للحوسبة العلمية والتحليل الاقتصادي.
+        تجمع بين سرعة لغات مثل C وسهولة لغات مثل Python.
+        </p>
+        </div>
+        """,
+        "why": """
+        <div class='success-box'>
+        <h3>لماذا Julia للاقتصاديين؟</h3>
+        <ul style='font-size: 1.1rem; line-height: 1.8;'>
+        <li>⚡ سرعة فائقة في المعادلات الاقتصادية المعقدة</li>
+        <li>📊 مكتبات قوية للتحليل الاقتصادي القياسي</li>
+        <li>🔢 دعم ممتاز للجبر الخطي والمصفوفات</li>
+        <li>🎯 سهولة في كتابة النماذج الاقتصادية</li>
+        <li>🆓 مجانية ومفتوحة المصدر</li>
+        </ul>
+        </div>
+        """,
+        "chart_title": "مقارنة السرعة (Julia = 100%)",
+        "chart_xaxis": "اللغة البرمجية",
+        "chart_yaxis": "السرعة النسبية",
+        "notes": """
+        <div class='warning-box'>
+        <h3>⚠️ ملاحظات مهمة</h3>
+        <p style='font-size: 1.1rem; line-height: 1.8;'>
+        • Julia تستخدم الترقيم من 1 (وليس من 0 مثل Python)<br>
+        • حساسة لحالة الأحرف (case-sensitive)<br>
+        • تحتاج لتجميع في المرة الأولى (compilation)<br>
+        • تستخدم ; لإخفاء المخرجات
+        </p>
+        </div>
+        """,
+    },
+    "en": {
+        "title": "## 🏠 Introduction to Julia",
+        "about": """
+        <div class='info-box'>
+        <h3>What is Julia?</h3>
+        <p style='font-size: 1.1rem; line-height: 1.8;'>
+        Julia is a modern, high-performance programming language designed specifically for scientific computing and economic analysis.
+        It combines the speed of languages like C with the ease of languages like Python.
+        </p>
+        </div>
+        """,
+        "why": """
+        <div class='success-box'>
+        <h3>Why Julia for Economists?</h3>
+        <ul style='font-size: 1.1rem; line-height: 1.8;'>
+        <li>⚡️ Superior speed for complex economic equations</li>
+        <li>📊 Powerful libraries for econometric analysis</li>
+        <li>🔢 Excellent support for linear algebra and matrices</li>
+        <li>🎯 Ease of writing economic models</li>
+        <li>🆓 Free and open-source</li>
+        </ul>
+        </div>
+        """,
+        "chart_title": "Speed Comparison (Julia = 100%)",
+        "chart_xaxis": "Programming Language",
+        "chart_yaxis": "Relative Speed",
+        "notes": """
+        <div class='warning-box'>
+        <h3>⚠️ Important Notes</h3>
+        <p style='font-size: 1.1rem; line-height: 1.8;'>
+        • Julia uses 1-based indexing (not 0-based like Python)<br>
+        • It is case-sensitive<br>
+        • It needs to compile on the first run (JIT compilation)<br>
+        • Use a semicolon (;) to suppress output
+        </p>
+        </div>
+        """,
+    },
+}
+
+# Performance comparison chart
+LANGUAGES = ['Julia', 'Python', 'R', 'MATLAB']
+SPEED = [1.0, 0.15, 0.12, 0.18]
+
+
+def speed_figure(locale):
+    import plotly.graph_objects as go
+
+    text = TEXT[locale]
+
+    fig = go.Figure(data=[
+        go.Bar(
+            x=LANGUAGES,
+            y=SPEED,
+            marker=dict(
+                color=['#667eea', '#fc466b', '#3f5efb', '#11998e'],
+                line=dict(color='white', width=2)
+            ),
+            text=[f'{s * 100:.0f}%' for s in SPEED],
+            textposition='auto',
+        )
+    ])
+
+    fig.update_layout(
+        title=dict(
+            text=text["chart_title"],
+            font=dict(size=20, color='#2d3748')
+        ),
+        xaxis_title=text["chart_xaxis"],
+        yaxis_title=text["chart_yaxis"],
+        template='plotly_white',
+        height=400
+    )
+    return fig
+
+
+def render(locale):
+    text = TEXT[locale]
+    st.markdown(text["title"])
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown(text["about"], unsafe_allow_html=True)
+        st.markdown(text["why"], unsafe_allow_html=True)
+
+    with col2:
+        figures.chart(speed_figure, locale, (LANGUAGES, SPEED, text))
+        st.markdown(text["notes"], unsafe_allow_html=True)
+
+
+def export(locale, page):
+    text = TEXT[locale]
+    page.markdown(text["title"])
+
+    col1, col2 = page.columns(2)
+    col1.markdown(text["about"])
+    col1.markdown(text["why"])
+    col2.chart(speed_figure, locale, (LANGUAGES, SPEED, text))
+    col2.markdown(text["notes"])
@@ -0,0 +1,51 @@
+"""Section 5: Loops."""
+
+import streamlit as st
+
+from julia_guide import cards
+
+TEXT = {
+    "ar": {
+        "title": "## 🔄 الحلقات التكرارية (Loops)",
+        "intro": """
+    <div class='info-box'>
+    <h3>أنواع الحلقات في Julia:</h3>
+    <ul style='font-size: 1.1rem; line-height: 1.8;'>
+    <li>🔁 <strong>for loop:</strong> للتكرار عدد محدد من المرات</li>
+    <li>🔁 <strong>while loop:</strong> للتكرار طالما الشرط صحيح</li>
+    <li>🔁 <strong>break:</strong> للخروج من الحلقة</li>
+    <li>🔁 <strong>continue:</strong> لتجاوز التكرار الحالي</li>
+    </ul>
+    </div>
+    """,
+    },
+    "en": {
+        "title": "## 🔄 Loops",
+        "intro": """
+    <div class='info-box'>
+    <h3>Types of Loops in Julia:</h3>
+    <ul style='font-size: 1.1rem; line-height: 1.8;'>
+    <li>🔁 <strong>for loop:</strong> To iterate a specific number of times.</li>
+    <li>🔁 <strong>while loop:</strong> To iterate as long as a condition is true.</li>
+    <li>🔁 <strong>break:</strong> To exit a loop.</li>
+    <li>🔁 <strong>continue:</strong> To skip the current iteration.</li>
+    </ul>
+    </div>
+    """,
+    },
+}
+
+
+def render(locale):
+    text = TEXT[locale]
+    st.markdown(text["title"])
+    st.markdown(text["intro"], unsafe_allow_html=True)
+
+    cards.render_examples(locale, "loops")
+
+
+def export(locale, page):
+    text = TEXT[locale]
+    page.markdown(text["title"])
+    page.markdown(text["intro"])
+    page.examples("loops")
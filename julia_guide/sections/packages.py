@@ -0,0 +1,11 @@
+"""Section 10: Economic Packages (under construction)."""
+
+from julia_guide.sections import _placeholder
+
+
+def render(locale):
+    _placeholder.render(locale, "packages")
+
+
+def export(locale, page):
+    _placeholder.export(locale, "packages", page)
@@ -0,0 +1,378 @@
+"""Section 8: Plotting."""
+
+import streamlit as st
+
+from julia_guide import figures, highlight
+
+TEXT = {
+    "ar": {
+        "title": "## 📈 الرسوم البيانية في Julia",
+        "intro": """
+    <div class='info-box'>
+    <h3>مكتبات الرسم في Julia:</h3>
+    <ul style='font-size: 1.1rem; line-height: 1.8;'>
+    <li>📊 <strong>Plots.jl:</strong> المكتبة الأساسية للرسوم</li>
+    <li>📈 <strong>StatsPlots.jl:</strong> رسوم إحصائية</li>
+    <li>🎨 <strong>PlotlyJS.jl:</strong> رسوم تفاعلية</li>
+    </ul>
+    </div>
+    """,
+        "examples": "### 📊 أمثلة تفاعلية",
+        "gdp_name": "الناتج المحلي",
+        "gdp_title": "تطور الناتج المحلي الإجمالي (2015-2024)",
+        "gdp_xaxis": "السنة",
+        "gdp_yaxis": "الناتج المحلي (مليار)",
+        "gdp_code": """
+# رسم خطي للسلاسل الزمنية
+using Plots
+
+سنوات = 2015:2024
+ناتج_محلي = [450, 470, 495, 510, 525, 505, 520, 560, 595, 630]
+
+plot(سنوات, ناتج_محلي, 
+    label="الناتج المحلي",
+    xlabel="السنة",
+    ylabel="الناتج المحلي (مليار)",
+    title="تطور الناتج المحلي الإجمالي",
+    lw=3,  # line width
+    marker=:circle,
+    markersize=8,
+    legend=:topleft,
+    color=:blue)
+    """,
+        "products": ["منتج A", "منتج B", "منتج C", "منتج D", "منتج E"],
+        "sales_title": "مبيعات المنتجات",
+        "sales_xaxis": "المنتج",
+        "sales_yaxis": "المبيعات",
+        "sales_code": """
+# رسم أعمدة للمبيعات
+using Plots
+
+منتجات = ["منتج A", "منتج B", "منتج C", "منتج D", "منتج E"]
+مبيعات = [45000, 38000, 52000, 41000, 49000]
+
+bar(منتجات, مبيعات,
+    title="مبيعات المنتجات",
+    xlabel="المنتج",
+    ylabel="المبيعات",
+    legend=false,
+    color=:viridis,
+    fillalpha=0.8)
+    """,
+        "categories": ["رواتب", "إيجار", "مواد خام", "تسويق", "أخرى"],
+        "expenses_title": "توزيع النفقات",
+        "expenses_code": """
+# رسم دائري للنفقات
+using Plots
+
+فئات = ["رواتب", "إيجار", "مواد خام", "تسويق", "أخرى"]
+قيم = [45, 20, 18, 12, 5]
+
+pie(فئات, قيم,
+    title="توزيع النفقات",
+    legend=:outerbottom,
+    l=0.5)
+    """,
+        "monthly_title": "مقارنة المبيعات الشهرية",
+        "monthly_xaxis": "الشهر",
+        "monthly_yaxis": "المبيعات (ألف)",
+        "monthly_code": """
+# رسم خطوط متعددة للمقارنة
+using Plots
+
+شهور = 1:12
+مبيعات_2023 = [120, 135, 142, 128, 155, 148, 162, 139, 175, 182, 195, 210]
+مبيعات_2024 = [125, 140, 148, 135, 162, 155, 170, 148, 185, 192, 205, 220]
+
+plot(شهور, مبيعات_2023, 
+    label="2023",
+    lw=2,
+    marker=:circle,
+    color=:blue)
+
+plot!(شهور, مبيعات_2024,
+    label="2024",
+    lw=2,
+    marker=:square,
+    color=:red,
+    xlabel="الشهر",
+    ylabel="المبيعات (ألف)",
+    title="مقارنة المبيعات الشهرية")
+    """,
+        "notes": """
+    <div class='warning-box'>
+    <h3>⚠️ ملاحظات مهمة:</h3>
+    <ul style='font-size: 1.1rem;'>
+    <li>استخدم <code>plot()</code> لإنشاء رسم جديد</li>
+    <li>استخدم <code>plot!()</code> لإضافة على رسم موجود (لاحظ !)</li>
+    <li><code>savefig("name.png")</code> لحفظ الرسم</li>
+    <li>يمكن تخصيص الألوان والأحجام والأنماط</li>
+    </ul>
+    </div>
+    """,
+    },
+    "en": {
+        "title": "## 📈 Plotting in Julia",
+        "intro": """
+    <div class='info-box'>
+    <h3>Plotting Libraries in Julia:</h3>
+    <ul style='font-size: 1.1rem; line-height: 1.8;'>
+    <li>📊 <strong>Plots.jl:</strong> The main library for plotting.</li>
+    <li>📈 <strong>StatsPlots.jl:</strong> For statistical plots.</li>
+    <li>🎨 <strong>PlotlyJS.jl:</strong> For interactive plots.</li>
+    </ul>
+    </div>
+    """,
+        "examples": "### 📊 Interactive Examples",
+        "gdp_name": "GDP",
+        "gdp_title": "Gross Domestic Product (GDP) Growth (2015-2024)",
+        "gdp_xaxis": "Year",
+        "gdp_yaxis": "GDP (in Billions)",
+        "gdp_code": """
+# Line plot for time series
+using Plots
+
+years = 2015:2024
+gdp = [450, 470, 495, 510, 525, 505, 520, 560, 595, 630]
+
+plot(years, gdp, 
+    label="GDP",
+    xlabel="Year",
+    ylabel="GDP (in Billions)",
+    title="GDP Growth",
+    lw=3,  # line width
+    marker=:circle,
+    markersize=8,
+    legend=:topleft,
+    color=:blue)
+    """,
+        "products": ["Product A", "Product B", "Product C", "Product D", "Product E"],
+        "sales_title": "Product Sales",
+        "sales_xaxis": "Product",
+        "sales_yaxis": "Sales",
+        "sales_code": """
+# Bar chart for sales
+using Plots
+
+products = ["Product A", "Product B", "Product C", "Product D", "Product E"]
+sales = [45000, 38000, 52000, 41000, 49000]
+
+bar(products, sales,
+    title="Product Sales",
+    xlabel="Product",
+    ylabel="Sales",
+    legend=false,
+    color=:viridis,
+    fillalpha=0.8)
+    """,
+        "categories": ["Salaries", "Rent", "Raw Materials", "Marketing", "Other"],
+        "expenses_title": "Distribution of Expenses",
+        "expenses_code": """
+# Pie chart for expenses
+using Plots
+
+categories = ["Salaries", "Rent", "Raw Materials", "Marketing", "Other"]
+values = [45, 20, 18, 12, 5]
+
+pie(categories, values,
+    title="Distribution of Expenses",
+    legend=:outerbottom,
+    l=0.5)
+    """,
+        "monthly_title": "Monthly Sales Comparison",
+        "monthly_xaxis": "Month",
+        "monthly_yaxis": "Sales (in Thousands)",
+        "monthly_code": """
+# Multiple line plot for comparison
+using Plots
+
+months = 1:12
+sales_2023 = [120, 135, 142, 128, 155, 148, 162, 139, 175, 182, 195, 210]
+sales_2024 = [125, 140, 148, 135, 162, 155, 170, 148, 185, 192, 205, 220]
+
+plot(months, sales_2023, 
+    label="2023",
+    lw=2,
+    marker=:circle,
+    color=:blue)
+
+plot!(months, sales_2024,
+    label="2024",
+    lw=2,
+    marker=:square,
+    color=:red,
+    xlabel="Month",
+    ylabel="Sales (in Thousands)",
+    title="Monthly Sales Comparison")
+    """,
+        "notes": """
+    <div class='warning-box'>
+    <h3>⚠️ Important Notes:</h3>
+    <ul style='font-size: 1.1rem;'>
+    <li>Use <code>plot()</code> to create a new plot.</li>
+    <li>Use <code>plot!()</code> to add to an existing plot (note the `!`).</li>
+    <li><code>savefig("name.png")</code> to save the plot.</li>
+    <li>You can customize colors, sizes, and styles.</li>
+    </ul>
+    </div>
+    """,
+    },
+}
+
+YEARS = list(range(2015, 2025))
+GDP = [450, 470, 495, 510, 525, 505, 520, 560, 595, 630]
+SALES = [45000, 38000, 52000, 41000, 49000]
+EXPENSE_SHARES = [45, 20, 18, 12, 5]
+MONTHS = list(range(1, 13))
+SALES_2023 = [120, 135, 142, 128, 155, 148, 162, 139, 175, 182, 195, 210]
+SALES_2024 = [125, 140, 148, 135, 162, 155, 170, 148, 185, 192, 205, 220]
+
+
+def gdp_figure(locale):
+    # Example 1: Line chart for time series
+    import plotly.graph_objects as go
+
+    text = TEXT[locale]
+
+    fig1 = go.Figure()
+    fig1.add_trace(go.Scatter(
+        x=YEARS,
+        y=GDP,
+        mode='lines+markers',
+        name=text["gdp_name"],
+        line=dict(color='#667eea', width=3),
+        marker=dict(size=10, color='#764ba2')
+    ))
+
+    fig1.update_layout(
+        title=text["gdp_title"],
+        xaxis_title=text["gdp_xaxis"],
+        yaxis_title=text["gdp_yaxis"],
+        template='plotly_white',
+        hovermode='x unified'
+    )
+    return fig1
+
+
+def sales_figure(locale):
+    # Example 2: Bar chart
+    import plotly.graph_objects as go
+
+    text = TEXT[locale]
+
+    fig2 = go.Figure(data=[
+        go.Bar(
+            x=text["products"],
+            y=SALES,
+            marker=dict(
+                color=SALES,
+                colorscale='Viridis',
+                showscale=True
+            ),
+            text=SALES,
+            textposition='auto',
+        )
+    ])
+
+    fig2.update_layout(
+        title=text["sales_title"],
+        xaxis_title=text["sales_xaxis"],
+        yaxis_title=text["sales_yaxis"],
+        template='plotly_white'
+    )
+    return fig2
+
+
+def expenses_figure(locale):
+    # Example 3: Pie chart
+    import plotly.graph_objects as go
+
+    text = TEXT[locale]
+
+    fig3 = go.Figure(data=[go.Pie(
+        labels=text["categories"],
+        values=EXPENSE_SHARES,
+        hole=.3,
+        marker=dict(colors=['#667eea', '#764ba2', '#fc466b', '#3f5efb', '#11998e'])
+    )])
+
+    fig3.update_layout(
+        title=text["expenses_title"],
+        template='plotly_white'
+    )
+    return fig3
+
+
+def monthly_figure(locale):
+    # Example 4: Multiple lines
+    import plotly.graph_objects as go
+
+    text = TEXT[locale]
+
+    fig4 = go.Figure()
+    fig4.add_trace(go.Scatter(
+        x=MONTHS,
+        y=SALES_2023,
+        mode='lines+markers',
+        name='2023',
+        line=dict(color='#667eea', width=2)
+    ))
+    fig4.add_trace(go.Scatter(
+        x=MONTHS,
+        y=SALES_2024,
+        mode='lines+markers',
+        name='2024',
+        line=dict(color='#fc466b', width=2)
+    ))
+
+    fig4.update_layout(
+        title=text["monthly_title"],
+        xaxis_title=text["monthly_xaxis"],
+        yaxis_title=text["monthly_yaxis"],
+        template='plotly_white',
+        hovermode='x unified'
+    )
+    return fig4
+
+
+def render(locale):
+    text = TEXT[locale]
+    st.markdown(text["title"])
+    st.markdown(text["intro"], unsafe_allow_html=True)
+
+    st.markdown(text["examples"])
+
+    figures.chart(gdp_figure, locale, (YEARS, GDP, text))
+    highlight.code(text["gdp_code"])
+
+    figures.chart(sales_figure, locale, (SALES, text))
+    highlight.code(text["sales_code"])
+
+    figures.chart(expenses_figure, locale, (EXPENSE_SHARES, text))
+    highlight.code(text["expenses_code"])
+
+    figures.chart(monthly_figure, locale, (MONTHS, SALES_2023, SALES_2024, text))
+    highlight.code(text["monthly_code"])
+
+    st.markdown(text["notes"], unsafe_allow_html=True)
+
+
+def export(locale, page):
+    text = TEXT[locale]
+    page.markdown(text["title"])
+    page.markdown(text["intro"])
+    page.markdown(text["examples"])
+
+    page.chart(gdp_figure, locale, (YEARS, GDP, text))
+    page.code(text["gdp_code"])
+
+    page.chart(sales_figure, locale, (SALES, text))
+    page.code(text["sales_code"])
+
+    page.chart(expenses_figure, locale, (EXPENSE_SHARES, text))
+    page.code(text["expenses_code"])
+
+    page.chart(monthly_figure, locale, (MONTHS, SALES_2023, SALES_2024, text))
+    page.code(text["monthly_code"])
+
+    page.markdown(text["notes"])
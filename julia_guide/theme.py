@@ -0,0 +1,264 @@
+"""Page chrome shared by the apps and the exporters: styles, header, footer."""
+
+import re
+from functools import lru_cache
+
+PAGE_TITLE = {
+    "ar": "دليل لغة Julia للاقتصاديين",
+    "en": "Julia Language Guide for Economists",
+}
+
+MENU_TITLE = {
+    "ar": "## 🎯 القائمة الرئيسية",
+    "en": "## 🎯 Main Menu",
+}
+
+LANGUAGES = {
+    "ar": "العربية",
+    "en": "English",
+}
+
+LANGUAGE_LABEL = {
+    "ar": "اللغة",
+    "en": "Language",
+}
+
+MENU_LABEL = {
+    "ar": "اختر القسم:",
+    "en": "Select a section:",
+}
+
+# Custom CSS for beautiful design
+CSS = {
+    "ar": """.main {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    direction: rtl;
+}
+.stApp {
+    background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+}
+.css-1d391kg {
+    direction: rtl;
+}
+.block-container {
+    padding: 2rem;
+    direction: rtl;
+}
+h1, h2, h3 {
+    color: #2d3748;
+    font-family: 'Arial', sans-serif;
+    direction: rtl;
+    text-align: right;
+}
+.stButton>button {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border-radius: 10px;
+    padding: 0.5rem 2rem;
+    border: none;
+    font-size: 16px;
+    font-weight: bold;
+    transition: all 0.3s;
+}
+.stButton>button:hover {
+    transform: scale(1.05);
+    box-shadow: 0 5px 15px rgba(0,0,0,0.3);
+}
+.code-block {
+    background-color: #1e1e1e;
+    color: #d4d4d4;
+    padding: 1rem;
+    border-radius: 10px;
+    direction: ltr;
+    text-align: left;
+    font-family: 'Courier New', monospace;
+}
+.output-block {
+    background-color: #f7fafc;
+    padding: 1rem;
+    border-radius: 10px;
+    border-left: 4px solid #667eea;
+    direction: ltr;
+    text-align: left;
+}
+.info-box {
+    background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%);
+    padding: 1.5rem;
+    border-radius: 15px;
+    border-right: 5px solid #667eea;
+    margin: 1rem 0;
+    direction: rtl;
+}
+.warning-box {
+    background: linear-gradient(135deg, #fc466b15 0%, #3f5efb15 100%);
+    padding: 1.5rem;
+    border-radius: 15px;
+    border-right: 5px solid #fc466b;
+    margin: 1rem 0;
+    direction: rtl;
+}
+.success-box {
+    background: linear-gradient(135deg, #11998e15 0%, #38ef7d15 100%);
+    padding: 1.5rem;
+    border-radius: 15px;
+    border-right: 5px solid #11998e;
+    margin: 1rem 0;
+    direction: rtl;
+}
+""",
+    "en": """.main {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+}
+.stApp {
+    background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+}
+.block-container {
+    padding: 2rem;
+}
+h1, h2, h3 {
+    color: #2d3748;
+    font-family: 'Arial', sans-serif;
+}
+.stButton>button {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border-radius: 10px;
+    padding: 0.5rem 2rem;
+    border: none;
+    font-size: 16px;
+    font-weight: bold;
+    transition: all 0.3s;
+}
+.stButton>button:hover {
+    transform: scale(1.05);
+    box-shadow: 0 5px 15px rgba(0,0,0,0.3);
+}
+.code-block {
+    background-color: #1e1e1e;
+    color: #d4d4d4;
+    padding: 1rem;
+    border-radius: 10px;
+    font-family: 'Courier New', monospace;
+}
+.output-block {
+    background-color: #f7fafc;
+    padding: 1rem;
+    border-radius: 10px;
+    border-left: 4px solid #667eea;
+}
+.info-box {
+    background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%);
+    padding: 1.5rem;
+    border-radius: 15px;
+    border-left: 5px solid #667eea;
+    margin: 1rem 0;
+}
+.warning-box {
+    background: linear-gradient(135deg, #fc466b15 0%, #3f5efb15 100%);
+    padding: 1.5rem;
+    border-radius: 15px;
+    border-left: 5px solid #fc466b;
+    margin: 1rem 0;
+}
+.success-box {
+    background: linear-gradient(135deg, #11998e15 0%, #38ef7d15 100%);
+    padding: 1.5rem;
+    border-radius: 15px;
+    border-left: 5px solid #11998e;
+    margin: 1rem 0;
+}
+""",
+}
+
+# Header and footer look; the markup below only carries the class names.
+# "div." outranks the heading styles Streamlit puts on markdown elements.
+CHROME_CSS = """div.guide-header h1 {
+    text-align: center;
+    color: #667eea;
+    font-size: 3rem;
+    margin-bottom: 0;
+}
+div.guide-header h3 {
+    text-align: center;
+    color: #764ba2;
+    margin-top: 0;
+}
+div.guide-header p {
+    text-align: center;
+    font-size: 1.2rem;
+    color: #4a5568;
+}
+div.guide-header hr {
+    border: 2px solid #667eea;
+    margin: 2rem 0;
+}
+div.guide-footer {
+    text-align: center;
+    padding: 2rem;
+    background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%);
+    border-radius: 15px;
+}
+div.guide-footer h2 {
+    color: #667eea;
+}
+div.guide-footer p {
+    font-size: 1.2rem;
+    color: #4a5568;
+}
+div.guide-footer p.note {
+    font-size: inherit;
+    color: #718096;
+}
+div.guide-footer p.contact {
+    font-size: inherit;
+    margin-top: 1rem;
+    color: #667eea;
+    font-weight: bold;
+}
+"""
+
+HEADER = {
+    "ar": """<div class='guide-header'>
+<h1>📊 دليل لغة Julia الشامل للاقتصاديين</h1>
+<h3>إعداد: د. مروان رودان</h3>
+<p>دليل تفاعلي احترافي للطلاب والباحثين العرب</p>
+<hr>
+</div>""",
+    "en": """<div class='guide-header'>
+<h1>📊 Comprehensive Julia Language Guide for Economists</h1>
+<h3>Prepared by: Dr. Marwan Roudan</h3>
+<p>An interactive, professional guide for students and researchers.</p>
+<hr>
+</div>""",
+}
+
+FOOTER = {
+    "ar": """<div class='guide-footer'>
+<h2>🎓 د.مروان رودان</h2>
+<p>دليل Julia الشامل للاقتصاديين العرب</p>
+<p class='note'>تم التصميم بعناية للطلاب والباحثين في الاقتصاد</p>
+<p class='contact'>📧 للاستفسارات والدعم الفني</p>
+</div>""",
+    "en": """<div class='guide-footer'>
+<h2>🎓 Dr. Marwan Roudan</h2>
+<p>Comprehensive Julia Guide for Economists</p>
+<p class='note'>Designed with care for students and researchers in economics.</p>
+<p class='contact'>📧 For inquiries and technical support</p>
+</div>""",
+}
+
+
+def minify(css):
+    """Drop comments, indentation and the spaces around CSS punctuation."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", " ".join(css.split())).replace(";}", "}")
+
+
+@lru_cache(maxsize=None)
+def style_tag(locale, *extra):
+    """Return the page styles for ``locale`` plus ``extra`` as one minified <style> block.
+
+    Built once per process; every rerun then re-sends one short element
+    instead of several indented blocks.
+    """
+    return "<style>{}</style>".format(minify("".join((CSS[locale], CHROME_CSS) + extra)))
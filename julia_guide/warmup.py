@@ -0,0 +1,187 @@
+"""Cache warmup at server start, with a readiness flag for load balancers.
+
+Start the server through this module instead of ``streamlit run``::
+
+    python -m julia_guide.warmup --ready-port 8502 julia.py --server.port 8501
+
+It builds the figures, highlighted code and card boxes of every section
+in both locales on a thread pool and starts the executor behind the Run
+buttons, then runs Streamlit in the same process
+so the app starts out with the warm caches. ``/ready`` on the readiness
+port answers 200 only once the warmup has succeeded and Streamlit's own
+``/_stcore/health`` answers, and 503 until then; point the load
+balancer's health check there.
+
+The warmup fails, and ``/ready`` keeps answering 503, when the executor
+cannot start (with the default backend: when Julia is missing; use
+``JULIA_EXECUTOR=replay`` on hosts without it) or when no section at all
+could be warmed. A single failing section is reported and left to build
+its caches on first use.
+"""
+
+import argparse
+import sys
+import threading
+import traceback
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from julia_guide import catalog, executors, figures, highlight, sections
+from julia_guide.cards import info_html, output_html
+
+_READY = threading.Event()
+_LOCK = threading.Lock()
+_started = False
+
+# Streamlit's health check; set by main(), which knows the server port.
+health_url = None
+
+
+class _Warmer:
+    """Takes the place of the export page and builds what a section shows.
+
+    Section modules describe their content through ``export(locale, page)``;
+    feeding them this object fills the caches without drawing anything.
+    """
+
+    def __init__(self, locale):
+        self.locale = locale
+
+    def _skip(self, *args, **kwargs):
+        pass
+
+    markdown = info = image = live = _skip
+
+    def columns(self, count):
+        return [self] * count
+
+    def code(self, source):
+        highlight.html(source)
+
+    def chart(self, builder, locale, data):
+        figures.get(builder, locale, data)
+
+    def examples(self, section, expanded=False):
+        for content in catalog.examples(self.locale, section).values():
+            highlight.html(content["code"])
+            output_html(content["output"])
+            info_html(content["rules"])
+
+
+def warm(locale, section):
+    sections.load(section).export(locale, _Warmer(locale))
+
+
+def start_executor():
+    executors.executor().start()
+
+
+def streamlit_healthy(url):
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status == 200
+    except (OSError, urllib.error.URLError):
+        return False
+
+
+def ready():
+    """True once the warmup succeeded and Streamlit answers its health check."""
+    return _READY.is_set() and (health_url is None or streamlit_healthy(health_url))
+
+
+def start(threads=4):
+    """Warm all sections in the background; later calls do nothing."""
+    global _started
+    with _LOCK:
+        if _started:
+            return
+        _started = True
+
+    def run():
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="warmup") as pool:
+            executor = pool.submit(start_executor)
+            warmed = [
+                pool.submit(warm, locale, section)
+                for locale in catalog.LOCALES
+                for section in catalog.SECTIONS
+            ]
+            executor_ok = _succeeded(executor)
+            # A failing section still renders, it just builds its caches
+            # on first use; only a warmup where nothing worked is fatal.
+            sections_ok = [_succeeded(future) for future in warmed]
+        if executor_ok and any(sections_ok):
+            _READY.set()
+        else:
+            print("Warmup failed; /ready stays unavailable.", file=sys.stderr)
+
+    threading.Thread(target=run, name="warmup", daemon=True).start()
+
+
+def _succeeded(future):
+    try:
+        future.result()
+    except Exception:
+        traceback.print_exc()
+        return False
+    return True
+
+
+def streamlit_health_url(streamlit_args):
+    """Return the URL of Streamlit's health check for these ``streamlit run`` arguments."""
+    options = {}
+    for index, arg in enumerate(streamlit_args):
+        if arg.startswith("--server."):
+            name, _, value = arg.partition("=")
+            if not value and index + 1 < len(streamlit_args):
+                value = streamlit_args[index + 1]
+            options[name] = value
+    port = options.get("--server.port", "8501")
+    base = options.get("--server.baseUrlPath", "").strip("/")
+    return f"http://127.0.0.1:{port}/{base + '/' if base else ''}_stcore/health"
+
+
+class _ReadyHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") != "/ready":
+            status, body = 404, b"not found\n"
+        elif ready():
+            status, body = 200, b"ready\n"
+        else:
+            status, body = 503, b"not ready\n"
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_readiness(port):
+    server = ThreadingHTTPServer(("", port), _ReadyHandler)
+    threading.Thread(target=server.serve_forever, name="readiness", daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm the caches, then run the app with Streamlit.")
+    parser.add_argument("--ready-port", type=int, default=8502, help="port of the /ready endpoint")
+    parser.add_argument("--workers", type=int, default=4, help="warmup threads")
+    parser.add_argument("script", help="app script, e.g. julia.py")
+    parser.add_argument("streamlit_args", nargs=argparse.REMAINDER, help="passed on to streamlit run")
+    args = parser.parse_args(argv)
+
+    from streamlit.web import cli
+
+    global health_url
+    health_url = streamlit_health_url(args.streamlit_args)
+    serve_readiness(args.ready_port)
+    start(args.workers)
+    return cli.main(["run", args.script, *args.streamlit_args], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""Pool of persistent Julia processes that run the examples.
+
+Each worker is a ``julia`` process started once and fed snippets over its
+stdin; it answers on stdout. Starting Julia and compiling ``println`` and
+friends takes seconds, so a warm worker turns a Run click into a few
+milliseconds of work. Every snippet runs in a fresh module, so
+definitions from one example never leak into the next.
+
+The pool is sized and tuned with environment variables:
+
+``JULIA_BIN``                  Julia executable (default ``julia``)
+``JULIA_POOL_SIZE``            worker processes (default 2)
+``JULIA_POOL_MIN_WORKERS``     idle workers kept past the idle timeout (default 1)
+``JULIA_WORKER_MAX_USES``      snippets a worker runs before it is replaced (default 200)
+``JULIA_WORKER_IDLE_TIMEOUT``  seconds an unused worker is kept (default 600)
+``JULIA_RUN_TIMEOUT``          seconds a snippet may run (default 30)
+"""
+
+import os
+import queue
+import subprocess
+import threading
+import time
+from collections import namedtuple
+
+Result = namedtuple("Result", "ok output")
+
+# Seconds a worker may take to start and load PRELOAD.
+START_TIMEOUT = 120
+
+# How often a waiting run checks whether it was cancelled.
+CANCEL_POLL = 0.05
+
+CANCELLED = Result(False, "Cancelled.")
+
+CRASHED = Result(False, "The Julia worker crashed while running this snippet.")
+
+# Standard libraries the examples use, loaded once per worker.
+PRELOAD = ("Printf", "Statistics")
+
+WORKER_SCRIPT = r"""
+for name in split(ARGS[1], ",", keepempty=false)
+    try
+        Core.eval(Main, :(using $(Symbol(name))))
+    catch
+    end
+end
+write(stdout, "ready $(VERSION)\n")
+flush(stdout)
+while true
+    header = readline(stdin)
+    isempty(header) && eof(stdin) && break
+    code = String(read(stdin, parse(Int, header)))
+    path, io = mktemp()
+    status = "ok"
+    try
+        redirect_stdout(io) do
+            redirect_stderr(io) do
+                include_string(Module(:Example), code, "example.jl")
+            end
+        end
+    catch err
+        status = "error"
+        showerror(io, err isa LoadError ? err.error : err)
+    end
+    close(io)
+    output = read(path)
+    rm(path)
+    write(stdout, "$status $(length(output))\n")
+    write(stdout, output)
+    flush(stdout)
+end
+"""
+
+
+class JuliaUnavailable(RuntimeError):
+    """Julia could not be started, so examples cannot be run."""
+
+
+class Worker:
+    """One julia process. It starts in the background; ``wait_ready`` waits for it."""
+
+    def __init__(self, julia="julia", preload=PRELOAD):
+        try:
+            self.process = subprocess.Popen(
+                [julia, "--startup-file=no", "--history-file=no", "-e", WORKER_SCRIPT, ",".join(preload)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as error:
+            raise JuliaUnavailable(str(error)) from error
+        self.uses = 0
+        self.last_used = time.monotonic()
+        # Replies are read on a thread so that a waiting caller can time out
+        # portably; pipes cannot be select()ed on every platform.
+        self._replies = queue.Queue()
+        threading.Thread(target=self._read, name="julia-reader", daemon=True).start()
+        self.version = None
+
+    def wait_ready(self, timeout=START_TIMEOUT):
+        reply = self._reply(timeout)
+        if not isinstance(reply, str):
+            self.close()
+            raise JuliaUnavailable("julia did not start")
+        self.version = reply
+        return self
+
+    def _read(self):
+        stdout = self.process.stdout
+        try:
+            while True:
+                header = stdout.readline()
+                if not header:
+                    break
+                if header.startswith(b"ready "):
+                    self._replies.put(header.split()[1].decode())
+                    continue
+                status, size = header.split()
+                self._replies.put(Result(status == b"ok", stdout.read(int(size)).decode("utf-8", "replace")))
+        except (OSError, ValueError):
+            pass
+        # The process is gone: wake a waiting caller now rather than at its timeout.
+        self._replies.put(CRASHED)
+
+    def _reply(self, timeout, cancelled=None):
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                return self._replies.get(timeout=remaining if cancelled is None else min(remaining, CANCEL_POLL))
+            except queue.Empty:
+                if cancelled is not None and cancelled.is_set():
+                    return CANCELLED
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def run(self, code, timeout, cancelled=None):
+        """Run ``code``; return a Result, or None if the worker did not answer in time.
+
+        Returns CRASHED if the process died, and CANCELLED as soon as the
+        ``cancelled`` event is set; the worker is then still busy and must
+        be closed.
+        """
+        data = code.encode("utf-8")
+        try:
+            self.process.stdin.write(b"%d\n" % len(data) + data)
+            self.process.stdin.flush()
+        except OSError:
+            return CRASHED
+        result = self._reply(timeout, cancelled)
+        self.uses += 1
+        self.last_used = time.monotonic()
+        return result
+
+    def close(self):
+        if self.alive():
+            self.process.kill()
+        self.process.wait()
+
+
+class JuliaPool:
+    """A fixed-size pool of warm workers.
+
+    Workers are started up front, retired after ``max_uses`` snippets,
+    killed when a snippet exceeds ``timeout`` or is cancelled, and reaped
+    after ``idle_timeout`` seconds without use down to ``min_workers``.
+    Replacements start in the background as soon as a worker goes, and
+    the pool grows back to ``size`` on the first run after reaping, so a
+    run only waits for Julia to start when no warm worker is left.
+    """
+
+    def __init__(
+        self, size=2, max_uses=200, idle_timeout=600, timeout=30, julia="julia", preload=PRELOAD, min_workers=1
+    ):
+        self.size = size
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.julia = julia
+        self.preload = preload
+        self.min_workers = min(min_workers, size)
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        # Workers running, idle or starting.
+        self._live = size
+        # Launch every process first and then wait on one shared deadline,
+        # so the pool starts in the time of its slowest worker.
+        started = []
+        try:
+            for _ in range(size):
+                started.append(Worker(julia, preload))
+            deadline = time.monotonic() + START_TIMEOUT
+            for worker in started:
+                worker.wait_ready(max(0, deadline - time.monotonic()))
+        except JuliaUnavailable:
+            for worker in started:
+                worker.close()
+            raise
+        for worker in started:
+            self._idle.put(worker)
+        self.version = started[-1].version
+        threading.Thread(target=self._reap, name="julia-reaper", daemon=True).start()
+
+    def _top_up(self):
+        """Start workers in the background until the pool is back to ``size``."""
+        with self._lock:
+            missing = self.size - self._live
+            self._live = self.size
+        for _ in range(missing):
+            threading.Thread(target=self._start_worker, name="julia-starter", daemon=True).start()
+
+    def _start_worker(self):
+        try:
+            worker = Worker(self.julia, self.preload).wait_ready()
+        except JuliaUnavailable:
+            with self._lock:
+                self._live -= 1
+            # Wakes a run waiting for this worker; it reports Julia unavailable.
+            self._idle.put(None)
+            return
+        self._idle.put(worker)
+
+    def _retire(self, worker):
+        worker.close()
+        with self._lock:
+            self._live -= 1
+
+    def _checkout(self):
+        # A run holds one of ``size`` slots, so once the pool is topped up
+        # some worker is always idle or starting.
+        self._top_up()
+        while True:
+            try:
+                worker = self._idle.get(timeout=START_TIMEOUT)
+            except queue.Empty:
+                raise JuliaUnavailable("no julia worker became ready") from None
+            if worker is None:
+                raise JuliaUnavailable("julia did not start")
+            if worker.alive():
+                return worker
+            self._retire(worker)
+            self._top_up()
+
+    def run(self, code, cancelled=None):
+        """Run ``code`` on a free worker, waiting for one if all are busy.
+
+        Setting the ``cancelled`` event kills the worker running the
+        snippet and returns CANCELLED at once. A worker that is retired,
+        timed out, crashed or cancelled is replaced in the background.
+        """
+        with self._slots:
+            worker = self._checkout()
+            result = worker.run(code, self.timeout, cancelled)
+            if result is None:
+                result = Result(False, f"Timed out after {self.timeout} seconds.")
+            elif result is not CANCELLED and result is not CRASHED and worker.uses < self.max_uses:
+                self._idle.put(worker)
+                return result
+            self._retire(worker)
+            self._top_up()
+            return result
+
+    def _reap(self):
+        while True:
+            time.sleep(min(self.idle_timeout, 60))
+            idle = []
+            while True:
+                try:
+                    worker = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if worker is not None:
+                    idle.append(worker)
+            # Most recently used first; the first ``min_workers`` stay warm.
+            idle.sort(key=lambda worker: worker.last_used, reverse=True)
+            keep = idle[: self.min_workers]
+            for worker in idle[self.min_workers :]:
+                if time.monotonic() - worker.last_used > self.idle_timeout:
+                    self._retire(worker)
+                else:
+                    keep.append(worker)
+            # Oldest first, so the most recently used worker is handed out next.
+            for worker in sorted(keep, key=lambda worker: worker.last_used):
+                self._idle.put(worker)
+
+
+_POOL_LOCK = threading.Lock()
+_pool = None
+
+
+def pool():
+    """Return the process-wide pool, starting it on first use.
+
+    Concurrent first callers wait for the one pool being started.
+    """
+    global _pool
+    if _pool is None:
+        with _POOL_LOCK:
+            if _pool is None:
+                _pool = JuliaPool(
+                    size=int(os.environ.get("JULIA_POOL_SIZE", 2)),
+                    max_uses=int(os.environ.get("JULIA_WORKER_MAX_USES", 200)),
+                    idle_timeout=float(os.environ.get("JULIA_WORKER_IDLE_TIMEOUT", 600)),
+                    timeout=float(os.environ.get("JULIA_RUN_TIMEOUT", 30)),
+                    julia=os.environ.get("JULIA_BIN", "julia"),
+                    min_workers=int(os.environ.get("JULIA_POOL_MIN_WORKERS", 1)),
+                )
+    return _pool
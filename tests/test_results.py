@@ -0,0 +1,68 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from julia_guide import executors, results
+
+
+class CountingExecutor(executors.Executor):
+    def __init__(self, latency=0.05):
+        super().__init__(concurrency=4)
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def execute(self, code, cancelled):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        yield f"ran {code}"
+
+
+class SlowDiskCache(results.ResultCache):
+    # A miss takes a while to come back from the file, so some callers
+    # only look for a pending run after the first one has finished.
+    def get(self, key):
+        output = super().get(key)
+        if output is None:
+            time.sleep(random.uniform(0, 0.05))
+        return output
+
+
+def test_concurrent_misses_run_once(tmp_path):
+    cache = SlowDiskCache(str(tmp_path / "results.sqlite3"))
+    executor = CountingExecutor(latency=0.01)
+    callers = 100
+    barrier = threading.Barrier(callers)
+
+    def call(_):
+        barrier.wait()
+        return cache.run("println(1)", executor)
+
+    with ThreadPoolExecutor(callers) as pool:
+        executions = list(pool.map(call, range(callers)))
+
+    assert executor.calls == 1
+    assert {execution.output for execution in executions} == {"ran println(1)"}
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(results, "MEMORY_ENTRIES", 2)
+    cache = results.ResultCache(str(tmp_path / "results.sqlite3"))
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+    assert list(cache._memory) == ["a", "c"]
+
+
+def test_unwritable_cache_still_runs(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv("JULIA_RESULT_CACHE", str(blocker / "results.sqlite3"))
+    executor = CountingExecutor(latency=0)
+    monkeypatch.setattr(executors, "executor", lambda: executor)
+    monkeypatch.setattr(results, "_cache", None)
+    execution = results.run("println(2)")
+    assert execution.ok and execution.output == "ran println(2)"